@@ -2,20 +2,12 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 from itertools import cycle
 from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.progress import (
-    BarColumn,
-    MofNCompleteColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-    TimeRemainingColumn,
-)
 
 from codeflash.cli_cmds.console_constants import SPINNER_TYPES
 from codeflash.cli_cmds.logging_config import BARE_LOGGING_FORMAT
@@ -23,7 +15,7 @@ from codeflash.cli_cmds.logging_config import BARE_LOGGING_FORMAT
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-    from rich.progress import TaskID
+    from rich.progress import Progress, ProgressColumn, TaskID
 
 DEBUG_MODE = logging.getLogger().getEffectiveLevel() == logging.DEBUG
 
@@ -65,6 +57,28 @@ def code_print(code_str: str) -> None:
 spinners = cycle(SPINNER_TYPES)
 
 
+@lru_cache(maxsize=1)
+def _shared_progress_columns() -> dict[str, tuple[ProgressColumn, ...]]:
+    """Build the progress columns shared by every progress bar.
+
+    rich.progress is imported here rather than at module level so that processes which never show a progress bar
+    (e.g. multiprocessing workers) do not pay for importing it. Columns without a max_refresh never read back their
+    renderable cache, so one instance is shared by every progress bar. TimeRemainingColumn does, keyed by task ids that
+    restart in each Progress, so it is created per progress bar.
+    """
+    from rich.progress import BarColumn, MofNCompleteColumn, TaskProgressColumn, TextColumn, TimeElapsedColumn
+
+    return {
+        "default": (TextColumn("[progress.description]{task.description}"), BarColumn(), TaskProgressColumn()),
+        "test_files": (
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(complete_style="cyan", finished_style="green", pulse_style="yellow"),
+            MofNCompleteColumn(),
+        ),
+        "time_elapsed": (TimeElapsedColumn(),),
+    }
+
+
 @contextmanager
 def progress_bar(
     message: str, *, transient: bool = False, revert_to_print: bool = False
@@ -76,18 +90,17 @@ def progress_bar(
     """
     if revert_to_print:
         logger.info(message)
-
-        # Create a fake task ID since we still need to yield something
-        class DummyTask:
-            def __init__(self) -> None:
-                self.id = 0
-
-        yield DummyTask().id
+        # There is no progress bar, so yield a placeholder task id
+        yield 0
     else:
+        from rich.progress import Progress, SpinnerColumn, TimeRemainingColumn
+
+        columns = _shared_progress_columns()
         progress = Progress(
             SpinnerColumn(next(spinners)),
-            *Progress.get_default_columns(),
-            TimeElapsedColumn(),
+            *columns["default"],
+            TimeRemainingColumn(),
+            *columns["time_elapsed"],
             console=console,
             transient=transient,
         )
@@ -99,12 +112,13 @@ def progress_bar(
 @contextmanager
 def test_files_progress_bar(total: int, description: str) -> Generator[tuple[Progress, TaskID], None, None]:
     """Progress bar for test files."""
+    from rich.progress import Progress, SpinnerColumn, TimeRemainingColumn
+
+    columns = _shared_progress_columns()
     with Progress(
         SpinnerColumn(next(spinners)),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(complete_style="cyan", finished_style="green", pulse_style="yellow"),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
+        *columns["test_files"],
+        *columns["time_elapsed"],
         TimeRemainingColumn(),
         transient=True,
     ) as progress:
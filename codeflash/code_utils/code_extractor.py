@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING, Optional
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional
 
 import libcst as cst
 from libcst.codemod import CodemodContext
@@ -13,7 +16,7 @@ from codeflash.cli_cmds.console import logger
 from codeflash.models.models import FunctionParent
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
     from libcst.helpers import ModuleNameAndPackage
 
@@ -21,30 +24,85 @@ if TYPE_CHECKING:
     from codeflash.models.models import FunctionSource
 
 
-class GlobalAssignmentCollector(cst.CSTVisitor):
-    """Collects all global assignment statements."""
+def _line_start_offsets(source_code: str) -> list[int]:
+    """Return the offset of the start of each line, with a sentinel entry for the end of the source."""
+    offsets = [0]
+    newline = source_code.find("\n")
+    while newline != -1:
+        offsets.append(newline + 1)
+        newline = source_code.find("\n", newline + 1)
+    offsets.append(len(source_code))
+    return offsets
+
+
+# ast.parse only creates these exact node types, so hot loops compare type(node) instead of calling isinstance
+_FUNCTION_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_FUNCTION_OR_CLASS_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef})
+
+# Fast path for the dunder check in get_code, every name in here passes the full check
+_COMMON_DUNDER_METHODS = frozenset(
+    {
+        "__init__",
+        "__repr__",
+        "__str__",
+        "__eq__",
+        "__hash__",
+        "__len__",
+        "__iter__",
+        "__next__",
+        "__enter__",
+        "__exit__",
+        "__call__",
+        "__getitem__",
+        "__setitem__",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_file(file_path: str, mtime_ns: int, size: int) -> tuple[str, ast.Module, list[int]]:  # noqa: ARG001
+    """Read and parse a python file, the stat arguments are part of the key so edited files are parsed again.
+
+    Also returns the line start offsets of the source so that line ranges can be sliced out of it directly.
+    """
+    source_code = Path(file_path).read_text(encoding="utf8")
+    return source_code, ast.parse(source_code), _line_start_offsets(source_code)
+
+
+@lru_cache(maxsize=256)
+def _parse_source(source_code: str) -> ast.Module:
+    return ast.parse(source_code)
+
+
+@lru_cache(maxsize=16)
+def _parse_cst_module(source_code: str) -> cst.Module:
+    # cst.Module is immutable, so the same tree can safely be shared between callers. libcst trees are many times
+    # larger than their source and only the few sources being merged right now are parsed again, so keep the cache small
+    return cst.parse_module(source_code)
+
+
+@lru_cache(maxsize=1024)
+def _module_and_package(project_root: str, file_path: str) -> ModuleNameAndPackage:
+    # The same few files are resolved against the same project root for every function being optimized
+    return calculate_module_and_package(project_root, file_path)
+
+
+class CombinedGlobalCollector(cst.CSTVisitor):
+    """Collects global assignments and global statements (excluding imports and functions/classes) in one pass."""
 
     def __init__(self) -> None:
         super().__init__()
         self.assignments: dict[str, cst.Assign] = {}
-        self.assignment_order: list[str] = []
-        # Track scope depth to identify global assignments
-        self.scope_depth = 0
+        self.global_statements: list[cst.SimpleStatementLine] = []
         self.if_else_depth = 0
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> Optional[bool]:
-        self.scope_depth += 1
-        return True
-
-    def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:
-        self.scope_depth -= 1
+        # Nothing inside a function is global, so don't visit its body
+        return False
 
     def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
-        self.scope_depth += 1
-        return True
-
-    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:
-        self.scope_depth -= 1
+        # Nothing inside a class is global, so don't visit its body
+        return False
 
     def visit_If(self, node: cst.If) -> Optional[bool]:
         self.if_else_depth += 1
@@ -58,41 +116,40 @@ class GlobalAssignmentCollector(cst.CSTVisitor):
         return True
 
     def visit_Assign(self, node: cst.Assign) -> Optional[bool]:
-        # Only process global assignments (not inside functions, classes, etc.)
-        if self.scope_depth == 0 and self.if_else_depth == 0:  # We're at module level
+        # Only process global assignments (not inside if/else blocks, functions and classes are never visited)
+        if self.if_else_depth == 0:  # We're at module level
             for target in node.targets:
                 if isinstance(target.target, cst.Name):
                     name = target.target.value
+                    # Dicts keep first insertion order, which is the order assignments are appended in
                     self.assignments[name] = node
-                    if name not in self.assignment_order:
-                        self.assignment_order.append(name)
         return True
 
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:
+        # Statements nested in if/else blocks are collected too, only functions and classes are skipped
+        for statement in node.body:
+            # Skip imports
+            if not isinstance(statement, (cst.Import, cst.ImportFrom, cst.Assign)):
+                self.global_statements.append(node)
+                break
+
 
 class GlobalAssignmentTransformer(cst.CSTTransformer):
     """Transforms global assignments in the original file with those from the new file."""
 
-    def __init__(self, new_assignments: dict[str, cst.Assign], new_assignment_order: list[str]) -> None:
+    def __init__(self, new_assignments: dict[str, cst.Assign]) -> None:
         super().__init__()
         self.new_assignments = new_assignments
-        self.new_assignment_order = new_assignment_order
         self.processed_assignments: set[str] = set()
-        self.scope_depth = 0
         self.if_else_depth = 0
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-        self.scope_depth += 1
-
-    def leave_FunctionDef(self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.FunctionDef:
-        self.scope_depth -= 1
-        return updated_node
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> None:
-        self.scope_depth += 1
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        # Assignments inside functions are never replaced, so don't visit the body
+        return False
 
-    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
-        self.scope_depth -= 1
-        return updated_node
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
+        # Assignments inside classes are never replaced, so don't visit the body
+        return False
 
     def visit_If(self, node: cst.If) -> None:
         self.if_else_depth += 1
@@ -106,7 +163,7 @@ class GlobalAssignmentTransformer(cst.CSTTransformer):
         pass
 
     def leave_Assign(self, original_node: cst.Assign, updated_node: cst.Assign) -> cst.CSTNode:
-        if self.scope_depth > 0 or self.if_else_depth > 0:
+        if self.if_else_depth > 0:
             return updated_node
 
         # Check if this is a global assignment we need to replace
@@ -125,9 +182,7 @@ class GlobalAssignmentTransformer(cst.CSTTransformer):
 
         # Find assignments to append
         assignments_to_append = [
-            self.new_assignments[name]
-            for name in self.new_assignment_order
-            if name not in self.processed_assignments and name in self.new_assignments
+            assignment for name, assignment in self.new_assignments.items() if name not in self.processed_assignments
         ]
 
         if assignments_to_append:
@@ -147,112 +202,40 @@ class GlobalAssignmentTransformer(cst.CSTTransformer):
         return updated_node.with_changes(body=new_statements)
 
 
-class GlobalStatementCollector(cst.CSTVisitor):
-    """Visitor that collects all global statements (excluding imports and functions/classes)."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.global_statements = []
-        self.in_function_or_class = False
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
-        # Don't visit inside classes
-        self.in_function_or_class = True
-        return False
-
-    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:
-        self.in_function_or_class = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
-        # Don't visit inside functions
-        self.in_function_or_class = True
-        return False
-
-    def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:
-        self.in_function_or_class = False
-
-    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:
-        if not self.in_function_or_class:
-            for statement in node.body:
-                # Skip imports
-                if not isinstance(statement, (cst.Import, cst.ImportFrom, cst.Assign)):
-                    self.global_statements.append(node)
-                    break
-
-
-class LastImportFinder(cst.CSTVisitor):
-    """Finds the position of the last import statement in the module."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.last_import_line = 0
-        self.current_line = 0
-
-    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:
-        self.current_line += 1
-        for statement in node.body:
-            if isinstance(statement, (cst.Import, cst.ImportFrom)):
-                self.last_import_line = self.current_line
-
-
 class ImportInserter(cst.CSTTransformer):
-    """Transformer that inserts global statements after the last import."""
+    """Transformer that inserts global statements after the last module level import."""
 
-    def __init__(self, global_statements: list[cst.SimpleStatementLine], last_import_line: int) -> None:
+    def __init__(self, global_statements: list[cst.SimpleStatementLine]) -> None:
         super().__init__()
         self.global_statements = global_statements
-        self.last_import_line = last_import_line
-        self.current_line = 0
-        self.inserted = False
 
-    def leave_SimpleStatementLine(
-        self, original_node: cst.SimpleStatementLine, updated_node: cst.SimpleStatementLine
-    ) -> cst.Module:
-        self.current_line += 1
-
-        # If we're right after the last import and haven't inserted yet
-        if self.current_line == self.last_import_line and not self.inserted:
-            self.inserted = True
-            return cst.Module(body=[updated_node, *self.global_statements])
-
-        return cst.Module(body=[updated_node])
+    def visit_Module(self, node: cst.Module) -> bool:
+        # Only the module body is changed, so nothing below it needs to be visited
+        return False
 
     def leave_Module(self, original_node: cst.Module, updated_node: cst.Module) -> cst.Module:
-        # If there were no imports, add at the beginning of the module
-        if self.last_import_line == 0 and not self.inserted:
-            updated_body = list(updated_node.body)
-            for stmt in reversed(self.global_statements):
-                updated_body.insert(0, stmt)
-            return updated_node.with_changes(body=updated_body)
-        return updated_node
-
-
-def extract_global_statements(source_code: str) -> list[cst.SimpleStatementLine]:
-    """Extract global statements from source code."""
-    module = cst.parse_module(source_code)
-    collector = GlobalStatementCollector()
-    module.visit(collector)
-    return collector.global_statements
-
-
-def find_last_import_line(target_code: str) -> int:
-    """Find the line number of the last import statement."""
-    module = cst.parse_module(target_code)
-    finder = LastImportFinder()
-    module.visit(finder)
-    return finder.last_import_line
+        body = updated_node.body
+        # If there are no imports, add at the beginning of the module
+        insert_index = 0
+        for index in range(len(body) - 1, -1, -1):
+            statement_line = body[index]
+            if isinstance(statement_line, cst.SimpleStatementLine) and any(
+                isinstance(statement, (cst.Import, cst.ImportFrom)) for statement in statement_line.body
+            ):
+                insert_index = index + 1
+                break
+        return updated_node.with_changes(body=[*body[:insert_index], *self.global_statements, *body[insert_index:]])
 
 
 class FutureAliasedImportTransformer(cst.CSTTransformer):
     def leave_ImportFrom(
         self, original_node: cst.ImportFrom, updated_node: cst.ImportFrom
     ) -> cst.BaseSmallStatement | cst.FlattenSentinel[cst.BaseSmallStatement] | cst.RemovalSentinel:
-        import libcst.matchers as m
-
+        # Besides a star import, the grammar only allows ImportAlias names, so no per-name matcher is needed
         if (
             (updated_node_module := updated_node.module)
             and updated_node_module.value == "__future__"
-            and all(m.matches(name, m.ImportAlias()) for name in updated_node.names)
+            and not isinstance(updated_node.names, cst.ImportStar)
         ):
             if names := [name for name in updated_node.names if name.asname is None]:
                 return updated_node.with_changes(names=names)
@@ -260,37 +243,152 @@ class FutureAliasedImportTransformer(cst.CSTTransformer):
         return updated_node
 
 
+# The imported names of a `from __future__ import ...` statement, parenthesized or continued with backslashes
+_FUTURE_IMPORT_NAMES_RE = re.compile(r"__future__[ \t\f\\\n]*import[ \t\f]*(?:\([^)]*\)|(?:[^\n;\\]|\\\n)*)")
+_AS_KEYWORD_RE = re.compile(r"\bas\b")
+
+
 def delete___future___aliased_imports(module_code: str) -> str:
-    return cst.parse_module(module_code).visit(FutureAliasedImportTransformer()).code
+    # Parsing with libcst is expensive, so only do it when there can be an aliased __future__ import
+    # A comment can hide the end of the names from the regex, so those are always parsed
+    if "__future__" not in module_code or not any(
+        "#" in (names := match.group()) or _AS_KEYWORD_RE.search(names)
+        for match in _FUTURE_IMPORT_NAMES_RE.finditer(module_code)
+    ):
+        return module_code
+    return _parse_cst_module(module_code).visit(FutureAliasedImportTransformer()).code
 
 
-def add_global_assignments(src_module_code: str, dst_module_code: str) -> str:
-    non_assignment_global_statements = extract_global_statements(src_module_code)
+def _walk_global_statements(body: list[ast.stmt], in_if: bool = False) -> Iterator[tuple[ast.stmt, bool]]:  # noqa: FBT001, FBT002
+    """Yield the statements outside functions and classes, mirroring the scope rules of CombinedGlobalCollector.
+
+    Each statement is paired with whether it is nested inside an if/elif/else block.
+    """
+    for node in body:
+        if (node_type := type(node)) in _FUNCTION_OR_CLASS_TYPES:
+            continue
+        yield node, in_if
+        nested_in_if = in_if or node_type is ast.If
+        for field in ("body", "orelse", "finalbody"):
+            yield from _walk_global_statements(getattr(node, field, []), nested_in_if)
+        for block in (*getattr(node, "handlers", []), *getattr(node, "cases", [])):
+            yield from _walk_global_statements(block.body, nested_in_if)
+
+
+def _node_source_span(source_code: str, line_offsets: list[int], node: ast.stmt) -> tuple[int, int] | None:
+    """Return the character span of a statement, or None if it is followed by a semicolon or line continuation."""
+    start_line = source_code[line_offsets[node.lineno - 1] : line_offsets[node.lineno]]
+    end_line = source_code[line_offsets[node.end_lineno - 1] : line_offsets[node.end_lineno]]  # type: ignore[operator]
+    # ast column offsets are utf-8 byte offsets
+    start_col = node.col_offset if start_line.isascii() else len(start_line.encode()[: node.col_offset].decode())
+    end_col = (
+        node.end_col_offset  # type: ignore[assignment]
+        if end_line.isascii()
+        else len(end_line.encode()[: node.end_col_offset].decode())
+    )
+    rest = end_line[end_col:].lstrip(" \t\f")
+    if rest and rest[0] not in "#\r\n":
+        return None
+    return line_offsets[node.lineno - 1] + start_col, line_offsets[node.end_lineno - 1] + end_col  # type: ignore[operator]
+
+
+def _line_indent(source_code: str, line_offsets: list[int], lineno: int) -> str:
+    line = source_code[line_offsets[lineno - 1] : line_offsets[lineno]]
+    return line[: len(line) - len(line.lstrip(" \t\f"))]
+
+
+def _add_global_assignments_by_splicing(src_module_code: str, dst_module_code: str) -> str | None:  # noqa: PLR0911
+    """Replace global assignments by splicing source text, skipping libcst entirely.
+
+    Only handles the cases where the result is guaranteed to be identical to the libcst transformation: the source has
+    no global statements to insert and every one of its global assignments replaces an existing assignment in the
+    destination. Returns None when the libcst path is needed.
+    """
+    for code in (src_module_code, dst_module_code):
+        if "\r" in code and code.count("\r") != code.count("\r\n"):
+            return None  # ast treats a lone carriage return as a newline
+    try:
+        src_tree = ast.parse(src_module_code)
+        dst_tree = ast.parse(dst_module_code)
+    except (SyntaxError, ValueError):
+        return None
+
+    new_assignments: dict[str, ast.Assign] = {}
+    for node, in_if in _walk_global_statements(src_tree.body):
+        if isinstance(node, ast.Assign):
+            if not in_if:
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        new_assignments[target.id] = node
+        elif (
+            not isinstance(node, (ast.Import, ast.ImportFrom))
+            and not hasattr(node, "body")
+            and not hasattr(node, "cases")
+        ):
+            return None  # A global statement needs to be inserted after the imports
+    if not new_assignments:
+        return dst_module_code
 
-    # Find the last import line in target
-    last_import_line = find_last_import_line(dst_module_code)
+    replacements: list[tuple[ast.Assign, ast.Assign]] = []
+    processed_assignments: set[str] = set()
+    for node, in_if in _walk_global_statements(dst_tree.body):
+        if in_if or not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in new_assignments:
+                processed_assignments.add(target.id)
+                replacements.append((node, new_assignments[target.id]))
+                break
+    if len(processed_assignments) != len(new_assignments):
+        return None  # New assignments have to be appended to the module
+
+    src_line_offsets = _line_start_offsets(src_module_code)
+    dst_line_offsets = _line_start_offsets(dst_module_code)
+    spans: list[tuple[int, int, str]] = []
+    for dst_node, src_node in replacements:
+        dst_span = _node_source_span(dst_module_code, dst_line_offsets, dst_node)
+        src_span = _node_source_span(src_module_code, src_line_offsets, src_node)
+        if dst_span is None or src_span is None:
+            return None
+        if src_node.end_lineno != src_node.lineno and _line_indent(
+            src_module_code, src_line_offsets, src_node.lineno
+        ) != _line_indent(dst_module_code, dst_line_offsets, dst_node.lineno):
+            return None  # libcst re-indents continuation lines relative to the enclosing block
+        spans.append((*dst_span, src_module_code[src_span[0] : src_span[1]]))
+    spans.sort()
+
+    pieces: list[str] = []
+    position = 0
+    for start, end, replacement in spans:
+        pieces.append(dst_module_code[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(dst_module_code[position:])
+    return "".join(pieces)
 
-    # Parse the target code
-    target_module = cst.parse_module(dst_module_code)
 
-    # Create transformer to insert non_assignment_global_statements
-    transformer = ImportInserter(non_assignment_global_statements, last_import_line)
-    #
-    # # Apply transformation
-    modified_module = target_module.visit(transformer)
-    dst_module_code = modified_module.code
+def add_global_assignments(src_module_code: str, dst_module_code: str) -> str:
+    # Most calls only touch existing global assignments, which plain text splicing handles exactly
+    spliced_code = _add_global_assignments_by_splicing(src_module_code, dst_module_code)
+    if spliced_code is not None:
+        return spliced_code
 
-    # Parse the code
-    original_module = cst.parse_module(dst_module_code)
-    new_module = cst.parse_module(src_module_code)
+    # Parse each module once and share the trees between the collectors and transformers below
+    src_module = cst.parse_module(src_module_code)
+    dst_module = cst.parse_module(dst_module_code)
 
-    # Collect assignments from the new file
-    new_collector = GlobalAssignmentCollector()
-    new_module.visit(new_collector)
+    # Collect global statements and assignments from the new file in a single traversal
+    new_collector = CombinedGlobalCollector()
+    src_module.visit(new_collector)
+
+    non_assignment_global_statements = new_collector.global_statements
+    if non_assignment_global_statements:
+        # Insert non_assignment_global_statements after the last import in target
+        dst_module = dst_module.visit(ImportInserter(non_assignment_global_statements))
 
     # Transform the original file
-    transformer = GlobalAssignmentTransformer(new_collector.assignments, new_collector.assignment_order)
-    transformed_module = original_module.visit(transformer)
+    transformer = GlobalAssignmentTransformer(new_collector.assignments)
+    transformed_module = dst_module.visit(transformer)
 
     return transformed_module.code
 
@@ -309,8 +407,8 @@ def add_needed_imports_from_module(
     if not helper_functions_fqn:
         helper_functions_fqn = {f.fully_qualified_name for f in (helper_functions or [])}
 
-    src_module_and_package: ModuleNameAndPackage = calculate_module_and_package(project_root, src_path)
-    dst_module_and_package: ModuleNameAndPackage = calculate_module_and_package(project_root, dst_path)
+    src_module_and_package: ModuleNameAndPackage = _module_and_package(str(project_root), str(src_path))
+    dst_module_and_package: ModuleNameAndPackage = _module_and_package(str(project_root), str(dst_path))
 
     dst_context: CodemodContext = CodemodContext(
         filename=src_path.name,
@@ -324,7 +422,7 @@ def add_needed_imports_from_module(
             full_package_name=src_module_and_package.package,
         )
     )
-    cst.parse_module(src_module_code).visit(gatherer)
+    _parse_cst_module(src_module_code).visit(gatherer)
     try:
         for mod in gatherer.module_imports:
             AddImportsVisitor.add_needed_import(dst_context, mod)
@@ -351,19 +449,36 @@ def add_needed_imports_from_module(
             RemoveImportsVisitor.remove_unused_import(dst_context, mod, alias_pair[0], asname=alias_pair[1])
 
     try:
-        parsed_module = cst.parse_module(dst_module_code)
+        parsed_module = _parse_cst_module(dst_module_code)
     except cst.ParserSyntaxError as e:
         logger.exception(f"Syntax error in destination module code: {e}")
         return dst_module_code  # Return the original code if there's a syntax error
     try:
-        transformed_module = AddImportsVisitor(dst_context).transform_module(parsed_module)
-        transformed_module = RemoveImportsVisitor(dst_context).transform_module(transformed_module)
+        # Each transform deep-copies and walks the whole module, so skip the ones that have nothing scheduled
+        transformed_module = parsed_module
+        if dst_context.scratch.get(AddImportsVisitor.CONTEXT_KEY):
+            transformed_module = AddImportsVisitor(dst_context).transform_module(transformed_module)
+        if dst_context.scratch.get(RemoveImportsVisitor.CONTEXT_KEY):
+            transformed_module = RemoveImportsVisitor(dst_context).transform_module(transformed_module)
         return transformed_module.code.lstrip("\n")
     except Exception as e:
         logger.exception(f"Error adding imports to destination module code: {e}")
         return dst_module_code
 
 
+def merge_line_ranges(line_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort inclusive (start, end) line ranges in place and merge the ones that overlap or touch."""
+    line_ranges.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in line_ranges:
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
 def get_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | None, set[tuple[str, str]]]:
     """Return the code for a function or methods in a Python module.
 
@@ -381,9 +496,9 @@ def get_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | Non
         return None, set()
 
     file_path: Path = functions_to_optimize[0].file_path
-    class_skeleton: set[tuple[int, int | None]] = set()
+    class_skeleton: list[tuple[int, int]] = []
     contextual_dunder_methods: set[tuple[str, str]] = set()
-    target_code: str = ""
+    target_pieces: list[str] = []
 
     def find_target(node_list: list[ast.stmt], name_parts: tuple[str, str] | tuple[str]) -> ast.AST | None:
         target: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef | ast.Assign | ast.AnnAssign | None = None
@@ -393,17 +508,17 @@ def get_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | Non
                 # The many mypy issues will be fixed once this code moves to the backend,
                 # using Type Guards as we move to 3.10+.
                 # We will cover the Type Alias case on the backend since it's a 3.12 feature.
-                isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == name_parts[0]
+                (node_type := type(node)) in _FUNCTION_OR_CLASS_TYPES and node.name == name_parts[0]
             ):
                 target = node
                 break
                 # The next two cases cover type aliases in pre-3.12 syntax, where only single assignment is allowed.
             if (
-                isinstance(node, ast.Assign)
+                node_type is ast.Assign
                 and len(node.targets) == 1
-                and isinstance(node.targets[0], ast.Name)
+                and type(node.targets[0]) is ast.Name
                 and node.targets[0].id == name_parts[0]
-            ) or (isinstance(node, ast.AnnAssign) and hasattr(node.target, "id") and node.target.id == name_parts[0]):
+            ) or (node_type is ast.AnnAssign and hasattr(node.target, "id") and node.target.id == name_parts[0]):
                 if class_skeleton:
                     break
                 target = node
@@ -412,39 +527,46 @@ def get_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | Non
         if target is None or len(name_parts) == 1:
             return target
 
-        if not isinstance(target, ast.ClassDef):
+        if type(target) is not ast.ClassDef:
             return None
-        class_skeleton.add((target.lineno, target.body[0].lineno - 1))
+        class_skeleton.append((target.lineno, target.body[0].lineno - 1))
         cbody = target.body
         if isinstance(cbody[0], ast.expr):  # Is a docstring
-            class_skeleton.add((cbody[0].lineno, cbody[0].end_lineno))
+            class_skeleton.append((cbody[0].lineno, cbody[0].end_lineno))
             cbody = cbody[1:]
             cnode: ast.stmt
         for cnode in cbody:
             # Collect all dunder methods.
             cnode_name: str
             if (
-                isinstance(cnode, (ast.FunctionDef, ast.AsyncFunctionDef))
-                and len(cnode_name := cnode.name) > 4
-                and cnode_name != name_parts[1]
-                and cnode_name.isascii()
-                and cnode_name.startswith("__")
-                and cnode_name.endswith("__")
+                type(cnode) in _FUNCTION_TYPES
+                and (cnode_name := cnode.name) != name_parts[1]
+                and (
+                    cnode_name in _COMMON_DUNDER_METHODS
+                    or (
+                        cnode_name[:2] == "__"
+                        and cnode_name[-2:] == "__"
+                        and len(cnode_name) > 4
+                        and cnode_name.isascii()
+                    )
+                )
             ):
                 contextual_dunder_methods.add((target.name, cnode_name))
-                class_skeleton.add((cnode.lineno, cnode.end_lineno))
+                class_skeleton.append((cnode.lineno, cnode.end_lineno))
 
         return find_target(target.body, name_parts[1:])
 
-    with file_path.open(encoding="utf8") as file:
-        source_code: str = file.read()
+    file_stat = file_path.stat()
     try:
-        module_node: ast.Module = ast.parse(source_code)
+        source_code, module_node, line_offsets = _parse_file(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
     except SyntaxError:
         logger.exception("get_code - Syntax error while parsing code")
         return None, set()
-    # Get the source code lines for the target node
-    lines: list[str] = source_code.splitlines(keepends=True)
+
+    def line_slice(s_lineno: int, e_lineno: int) -> str:
+        # Source code of the lines s_lineno to e_lineno inclusive, sliced without splitting the source into lines
+        return source_code[line_offsets[s_lineno - 1] : line_offsets[e_lineno]]
+
     if len(functions_to_optimize[0].parents) == 1:
         if (
             functions_to_optimize[0].parents[0].type == "ClassDef"
@@ -469,18 +591,16 @@ def get_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | Non
         if target_node is None:
             continue
 
-        if (
-            isinstance(target_node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-            and target_node.decorator_list
-        ):
-            target_code += "".join(lines[target_node.decorator_list[0].lineno - 1 : target_node.end_lineno])
+        if type(target_node) in _FUNCTION_OR_CLASS_TYPES and target_node.decorator_list:
+            target_pieces.append(line_slice(target_node.decorator_list[0].lineno, target_node.end_lineno))
         else:
-            target_code += "".join(lines[target_node.lineno - 1 : target_node.end_lineno])
-    if not target_code:
+            target_pieces.append(line_slice(target_node.lineno, target_node.end_lineno))
+    if not target_pieces:
         return None, set()
-    class_list: list[tuple[int, int | None]] = sorted(class_skeleton)
-    class_code = "".join(["".join(lines[s_lineno - 1 : e_lineno]) for (s_lineno, e_lineno) in class_list])
-    return class_code + target_code, contextual_dunder_methods
+    # The same class header is collected once per method, so duplicated and overlapping ranges are merged first.
+    # Targets stay in the order they were requested in.
+    class_pieces = [line_slice(s_lineno, e_lineno) for (s_lineno, e_lineno) in merge_line_ranges(class_skeleton)]
+    return "".join(class_pieces + target_pieces), contextual_dunder_methods
 
 
 def extract_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str | None, set[tuple[str, str]]]:
@@ -495,20 +615,52 @@ def extract_code(functions_to_optimize: list[FunctionToOptimize]) -> tuple[str |
     return edited_code, contextual_dunder_methods
 
 
+class PreexistingObjectsFinder(ast.NodeVisitor):
+    """Collects module level functions and classes, and the methods of those classes."""
+
+    def __init__(self) -> None:
+        self.preexisting_objects: set[tuple[str, tuple[FunctionParent, ...]]] = set()
+
+    def visit(self, node: ast.AST) -> None:
+        # Look the visitor up by node type instead of NodeVisitor's getattr on the class name for every node
+        visitor = self.dispatch.get(type(node))
+        if visitor is not None:
+            visitor(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Only module level definitions matter, so nothing else is descended into
+        return
+
+    def visit_Module(self, node: ast.Module) -> None:
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # Nested functions are not preexisting objects, so the body is not visited
+        self.preexisting_objects.add((node.name, ()))
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.preexisting_objects.add((node.name, ()))
+        parents = (FunctionParent(node.name, "ClassDef"),)
+        for cnode in node.body:
+            if type(cnode) in _FUNCTION_TYPES:
+                self.preexisting_objects.add((cnode.name, parents))
+
+    dispatch: ClassVar[dict[type[ast.AST], Callable[[PreexistingObjectsFinder, Any], None]]] = {
+        ast.Module: visit_Module,
+        ast.FunctionDef: visit_FunctionDef,
+        ast.AsyncFunctionDef: visit_FunctionDef,
+        ast.ClassDef: visit_ClassDef,
+    }
+
+
 def find_preexisting_objects(source_code: str) -> set[tuple[str, tuple[FunctionParent, ...]]]:
     """Find all preexisting functions, classes or class methods in the source code."""
-    preexisting_objects: set[tuple[str, tuple[FunctionParent, ...]]] = set()
     try:
-        module_node: ast.Module = ast.parse(source_code)
+        module_node: ast.Module = _parse_source(source_code)
     except SyntaxError:
         logger.exception("find_preexisting_objects - Syntax error while parsing code")
-        return preexisting_objects
-    for node in module_node.body:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            preexisting_objects.add((node.name, ()))
-        elif isinstance(node, ast.ClassDef):
-            preexisting_objects.add((node.name, ()))
-            for cnode in node.body:
-                if isinstance(cnode, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    preexisting_objects.add((cnode.name, (FunctionParent(node.name, "ClassDef"),)))
-    return preexisting_objects
+        return set()
+    finder = PreexistingObjectsFinder()
+    finder.visit(module_node)
+    return finder.preexisting_objects
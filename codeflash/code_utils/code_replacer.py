@@ -429,7 +429,8 @@ def replace_function_definitions_in_module(
 
 
 def is_zero_diff(original_code: str, new_code: str) -> bool:
-    return normalize_code(original_code) == normalize_code(new_code)
+    # most unchanged files are byte-identical, which needs no parsing to tell
+    return original_code == new_code or normalize_code(original_code) == normalize_code(new_code)
 
 
 def replace_optimized_code(
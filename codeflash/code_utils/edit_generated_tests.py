@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import ast
+import io
 import os
 import re
+import tokenize
 from pathlib import Path
-from textwrap import dedent
 from typing import TYPE_CHECKING, Union
 
-import libcst as cst
-
 from codeflash.cli_cmds.console import logger
 from codeflash.code_utils.time_utils import format_perf, format_time
 from codeflash.models.models import GeneratedTests, GeneratedTestsList
@@ -18,6 +17,11 @@ if TYPE_CHECKING:
     from codeflash.models.models import InvocationId
     from codeflash.verification.verification_utils import TestConfig
 
+# header lines of compound statements, a statement after their colon is not a statement line of its own
+_COMPOUND_STATEMENT_KEYWORDS = frozenset(
+    {"if", "elif", "else", "for", "while", "try", "except", "finally", "with", "async", "@"}
+)
+
 
 def remove_functions_from_generated_tests(
     generated_tests: GeneratedTestsList, test_functions_to_remove: list[str]
@@ -132,6 +136,175 @@ def find_codeflash_output_assignments(source_code: str) -> list[int]:
     return visitor.results
 
 
+def _codeflash_output_lines(function_node: ast.FunctionDef | ast.AsyncFunctionDef) -> tuple[int, ...]:
+    # line numbers are relative to the ast normalized function body, which is how the instrumentation numbers them
+    normalized_body_code = ast.unparse(ast.Module(body=function_node.body, type_ignores=[]))
+    return tuple(sorted(find_codeflash_output_assignments(normalized_body_code)))
+
+
+def _is_codeflash_output_assignment(statement: list[tokenize.TokenInfo]) -> bool:
+    """Check if the tokens of a simple statement are a plain `codeflash_output = value` assignment."""
+    if len(statement) < 2 or statement[0].string != "codeflash_output" or statement[1].string != "=":
+        return False
+    bracket_depth = 0
+    for token in statement[2:]:
+        if token.type != tokenize.OP:
+            if token.string == "lambda" and bracket_depth == 0:
+                break
+            continue
+        if token.string in "([{":
+            bracket_depth += 1
+        elif token.string in ")]}":
+            bracket_depth -= 1
+        elif token.string == "=" and bracket_depth == 0:
+            # chained assignment, codeflash_output is not the only target
+            return False
+    return True
+
+
+def _find_codeflash_output_statements(source: str) -> list[tuple[tuple[str, ...], int | None, int, int]]:
+    """Find the statement lines that assign to codeflash_output with a single tokenize pass.
+
+    Returns (enclosing class/function names, line of the last entered function, row, end column of the code) for each.
+    """
+    statements: list[tuple[tuple[str, ...], int | None, int, int]] = []
+    context_stack: list[tuple[str, int]] = []  # (name, indentation depth)
+    function_lineno: int | None = None
+    depth = 0
+    line_depth = 0
+    logical_line: list[tokenize.TokenInfo] = []
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.INDENT:
+            depth += 1
+        elif token.type == tokenize.DEDENT:
+            depth -= 1
+        elif token.type not in (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE, tokenize.ENDMARKER):
+            if not logical_line:
+                line_depth = depth
+            logical_line.append(token)
+        elif token.type in (tokenize.NEWLINE, tokenize.ENDMARKER) and logical_line:
+            while context_stack and context_stack[-1][1] >= line_depth:
+                context_stack.pop()
+            first = logical_line[0]
+            keyword = logical_line[1].string if first.string == "async" else first.string
+            if keyword in {"def", "class"}:
+                name_index = 2 if first.string == "async" else 1
+                context_stack.append((logical_line[name_index].string, line_depth))
+                if keyword == "def":
+                    function_lineno = first.start[0]
+            elif first.string not in _COMPOUND_STATEMENT_KEYWORDS:
+                statement: list[tokenize.TokenInfo] = []
+                for tok in [*logical_line, None]:
+                    if tok is not None and tok.string != ";":
+                        statement.append(tok)
+                        continue
+                    if _is_codeflash_output_assignment(statement):
+                        end_row, end_col = logical_line[-1].end
+                        statements.append((tuple(name for name, _ in context_stack), function_lineno, end_row, end_col))
+                        break
+                    statement = []
+            logical_line = []
+    return statements
+
+
+def _annotate_lines(source: str, line_to_comment: dict[int, tuple[int, str]]) -> str:
+    """Replace the trailing whitespace and comment after the code on the given lines with a new comment."""
+    # split like tokenize counts rows, str.splitlines would also break on form feeds and other line boundaries
+    lines = io.StringIO(source, newline="").readlines()
+    for row, (code_end_col, comment) in line_to_comment.items():
+        line = lines[row - 1]
+        newline = line[len(line.rstrip("\r\n")) :]
+        lines[row - 1] = f"{line[:code_end_col]} {comment}{newline}"
+    return "".join(lines)
+
+
+def _add_runtime_comments_to_source(
+    source: str,
+    *,
+    behavior_file_path: Path,
+    perf_file_path: Path,
+    tests_root: Path,
+    rel_tests_root: Path,
+    original_runtimes: dict[InvocationId, list[int]],
+    optimized_runtimes: dict[InvocationId, list[int]],
+) -> str:
+    test_file_rel_paths = [behavior_file_path.relative_to(tests_root), perf_file_path.relative_to(tests_root)]
+    codeflash_output_statements = _find_codeflash_output_statements(source)
+    if not codeflash_output_statements:
+        return source
+    cfo_locs_by_function_lineno = {
+        node.lineno: _codeflash_output_lines(node)
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    line_to_comment: dict[int, tuple[int, str]] = {}
+    current_function_lineno: int | None = None
+    cfo_locs: tuple[int, ...] = ()
+    cfo_idx_loc_to_look_at = -1
+    for context, function_lineno, row, code_end_col in codeflash_output_statements:
+        if function_lineno != current_function_lineno:
+            # sorted in order we will encounter them
+            current_function_lineno = function_lineno
+            cfo_locs = cfo_locs_by_function_lineno.get(function_lineno, ())  # type: ignore[arg-type]
+            cfo_idx_loc_to_look_at = -1
+        # Find matching test cases by looking for this test function name in the test results
+        cfo_idx_loc_to_look_at += 1
+        qualified_test_name = ".".join(context)
+        matching_original_times = []
+        matching_optimized_times = []
+        # TODO : will not work if there are multiple test cases with the same name, match filename + test class + test function name + invocationid
+        for invocation_id, runtimes in original_runtimes.items():
+            # get position here and match in if condition
+            qualified_name = (
+                invocation_id.test_class_name + "." + invocation_id.test_function_name  # type: ignore[operator]
+                if invocation_id.test_class_name
+                else invocation_id.test_function_name
+            )
+            rel_path = (
+                Path(invocation_id.test_module_path.replace(".", os.sep)).with_suffix(".py").relative_to(rel_tests_root)
+            )
+            if (
+                qualified_name == qualified_test_name
+                and rel_path in test_file_rel_paths
+                and int(invocation_id.iteration_id.split("_")[0]) == cfo_locs[cfo_idx_loc_to_look_at]  # type:ignore[union-attr]
+            ):
+                matching_original_times.extend(runtimes)
+
+        for invocation_id, runtimes in optimized_runtimes.items():
+            # get position here and match in if condition
+            qualified_name = (
+                invocation_id.test_class_name + "." + invocation_id.test_function_name  # type: ignore[operator]
+                if invocation_id.test_class_name
+                else invocation_id.test_function_name
+            )
+            rel_path = (
+                Path(invocation_id.test_module_path.replace(".", os.sep)).with_suffix(".py").relative_to(rel_tests_root)
+            )
+            if (
+                qualified_name == qualified_test_name
+                and rel_path in test_file_rel_paths
+                and int(invocation_id.iteration_id.split("_")[0]) == cfo_locs[cfo_idx_loc_to_look_at]  # type:ignore[union-attr]
+            ):
+                matching_optimized_times.extend(runtimes)
+
+        if matching_original_times and matching_optimized_times:
+            original_time = min(matching_original_times)
+            optimized_time = min(matching_optimized_times)
+            if original_time != 0 and optimized_time != 0:
+                perf_gain = format_perf(
+                    abs(performance_gain(original_runtime_ns=original_time, optimized_runtime_ns=optimized_time) * 100)
+                )
+                status = "slower" if optimized_time > original_time else "faster"
+                # Create the runtime comment
+                line_to_comment[row] = (
+                    code_end_col,
+                    f"# {format_time(original_time)} -> {format_time(optimized_time)} ({perf_gain}% {status})",
+                )
+
+    return _annotate_lines(source, line_to_comment)
+
+
 def add_runtime_comments_to_generated_tests(
     test_cfg: TestConfig,
     generated_tests: GeneratedTestsList,
@@ -143,150 +316,20 @@ def add_runtime_comments_to_generated_tests(
     module_root = test_cfg.project_root_path
     rel_tests_root = tests_root.relative_to(module_root)
 
-    # TODO: reduce for loops to one
-    class RuntimeCommentTransformer(cst.CSTTransformer):
-        def __init__(self, module: cst.Module, test: GeneratedTests, tests_root: Path, rel_tests_root: Path) -> None:
-            super().__init__()
-            self.test = test
-            self.context_stack: list[str] = []
-            self.tests_root = tests_root
-            self.rel_tests_root = rel_tests_root
-            self.module = module
-            self.cfo_locs: list[int] = []
-            self.cfo_idx_loc_to_look_at: int = -1
-
-        def visit_ClassDef(self, node: cst.ClassDef) -> None:
-            # Track when we enter a class
-            self.context_stack.append(node.name.value)
-
-        def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:  # noqa: ARG002
-            # Pop the context when we leave a class
-            self.context_stack.pop()
-            return updated_node
-
-        def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-            # convert function body to ast normalized string and find occurrences of codeflash_output
-            body_code = dedent(self.module.code_for_node(node.body))
-            normalized_body_code = ast.unparse(ast.parse(body_code))
-            self.cfo_locs = sorted(
-                find_codeflash_output_assignments(normalized_body_code)
-            )  # sorted in order we will encounter them
-            self.cfo_idx_loc_to_look_at = -1
-            self.context_stack.append(node.name.value)
-
-        def leave_FunctionDef(self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.FunctionDef:  # noqa: ARG002
-            # Pop the context when we leave a function
-            self.context_stack.pop()
-            return updated_node
-
-        def leave_SimpleStatementLine(
-            self,
-            original_node: cst.SimpleStatementLine,  # noqa: ARG002
-            updated_node: cst.SimpleStatementLine,
-        ) -> cst.SimpleStatementLine:
-            # Look for assignment statements that assign to codeflash_output
-            # Handle both single statements and multiple statements on one line
-            codeflash_assignment_found = False
-            for stmt in updated_node.body:
-                if isinstance(stmt, cst.Assign) and (
-                    len(stmt.targets) == 1
-                    and isinstance(stmt.targets[0].target, cst.Name)
-                    and stmt.targets[0].target.value == "codeflash_output"
-                ):
-                    codeflash_assignment_found = True
-                    break
-
-            if codeflash_assignment_found:
-                # Find matching test cases by looking for this test function name in the test results
-                self.cfo_idx_loc_to_look_at += 1
-                matching_original_times = []
-                matching_optimized_times = []
-                # TODO : will not work if there are multiple test cases with the same name, match filename + test class + test function name + invocationid
-                for invocation_id, runtimes in original_runtimes.items():
-                    # get position here and match in if condition
-                    qualified_name = (
-                        invocation_id.test_class_name + "." + invocation_id.test_function_name  # type: ignore[operator]
-                        if invocation_id.test_class_name
-                        else invocation_id.test_function_name
-                    )
-                    rel_path = (
-                        Path(invocation_id.test_module_path.replace(".", os.sep))
-                        .with_suffix(".py")
-                        .relative_to(self.rel_tests_root)
-                    )
-                    if (
-                        qualified_name == ".".join(self.context_stack)
-                        and rel_path
-                        in [
-                            self.test.behavior_file_path.relative_to(self.tests_root),
-                            self.test.perf_file_path.relative_to(self.tests_root),
-                        ]
-                        and int(invocation_id.iteration_id.split("_")[0]) == self.cfo_locs[self.cfo_idx_loc_to_look_at]  # type:ignore[union-attr]
-                    ):
-                        matching_original_times.extend(runtimes)
-
-                for invocation_id, runtimes in optimized_runtimes.items():
-                    # get position here and match in if condition
-                    qualified_name = (
-                        invocation_id.test_class_name + "." + invocation_id.test_function_name  # type: ignore[operator]
-                        if invocation_id.test_class_name
-                        else invocation_id.test_function_name
-                    )
-                    rel_path = (
-                        Path(invocation_id.test_module_path.replace(".", os.sep))
-                        .with_suffix(".py")
-                        .relative_to(self.rel_tests_root)
-                    )
-                    if (
-                        qualified_name == ".".join(self.context_stack)
-                        and rel_path
-                        in [
-                            self.test.behavior_file_path.relative_to(self.tests_root),
-                            self.test.perf_file_path.relative_to(self.tests_root),
-                        ]
-                        and int(invocation_id.iteration_id.split("_")[0]) == self.cfo_locs[self.cfo_idx_loc_to_look_at]  # type:ignore[union-attr]
-                    ):
-                        matching_optimized_times.extend(runtimes)
-
-                if matching_original_times and matching_optimized_times:
-                    original_time = min(matching_original_times)
-                    optimized_time = min(matching_optimized_times)
-                    if original_time != 0 and optimized_time != 0:
-                        perf_gain = format_perf(
-                            abs(
-                                performance_gain(original_runtime_ns=original_time, optimized_runtime_ns=optimized_time)
-                                * 100
-                            )
-                        )
-                        status = "slower" if optimized_time > original_time else "faster"
-                        # Create the runtime comment
-                        comment_text = (
-                            f"# {format_time(original_time)} -> {format_time(optimized_time)} ({perf_gain}% {status})"
-                        )
-
-                        # Add comment to the trailing whitespace
-                        new_trailing_whitespace = cst.TrailingWhitespace(
-                            whitespace=cst.SimpleWhitespace(" "),
-                            comment=cst.Comment(comment_text),
-                            newline=updated_node.trailing_whitespace.newline,
-                        )
-
-                        return updated_node.with_changes(trailing_whitespace=new_trailing_whitespace)
-
-            return updated_node
-
     # Process each generated test
     modified_tests = []
     for test in generated_tests.generated_tests:
         try:
-            # Parse the test source code
-            tree = cst.parse_module(test.generated_original_test_source)
-            # Transform the tree to add runtime comments
-            transformer = RuntimeCommentTransformer(tree, test, tests_root, rel_tests_root)
-            modified_tree = tree.visit(transformer)
-
-            # Convert back to source code
-            modified_source = modified_tree.code
+            # Transform the source to add runtime comments
+            modified_source = _add_runtime_comments_to_source(
+                test.generated_original_test_source,
+                behavior_file_path=test.behavior_file_path,
+                perf_file_path=test.perf_file_path,
+                tests_root=tests_root,
+                rel_tests_root=rel_tests_root,
+                original_runtimes=original_runtimes,
+                optimized_runtimes=optimized_runtimes,
+            )
 
             # Create a new GeneratedTests object with the modified source
             modified_test = GeneratedTests(
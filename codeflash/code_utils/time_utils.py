@@ -3,6 +3,19 @@ import re
 
 import humanize
 
+# (divisor, template) by number of digits, templates format the value or its integer part (for values >= 100)
+_TIME_FORMATS = {
+    4: (1_000, "{0:.2f}μs"),
+    5: (1_000, "{0:.1f}μs"),
+    6: (1_000, "{1}μs"),
+    7: (1_000_000, "{0:.2f}ms"),
+    8: (1_000_000, "{0:.1f}ms"),
+    9: (1_000_000, "{1}ms"),
+    10: (1_000_000_000, "{0:.2f}s"),
+    11: (1_000_000_000, "{0:.1f}s"),
+}
+_WHOLE_SECONDS_FORMAT = (1_000_000_000, "{1}s")
+
 
 def humanize_runtime(time_in_ns: int) -> str:
     runtime_human: str = str(time_in_ns)
@@ -58,33 +71,14 @@ def format_time(nanoseconds: int) -> str:
         raise TypeError("Input must be an integer.")
     if nanoseconds < 0:
         raise ValueError("Input must be a positive integer.")
-    conversions = [(1_000_000_000, "s"), (1_000_000, "ms"), (1_000, "μs"), (1, "ns")]
 
     # Handle nanoseconds case directly (no decimal formatting needed)
     if nanoseconds < 1_000:
         return f"{nanoseconds}ns"
 
-    # Find appropriate unit
-    for divisor, unit in conversions:
-        if nanoseconds >= divisor:
-            value = nanoseconds / divisor
-            int_value = nanoseconds // divisor
-
-            # Use integer formatting for values >= 100
-            if int_value >= 100:
-                formatted_value = f"{int_value:.0f}"
-            # Format with precision for 3 significant digits
-            elif value >= 100:
-                formatted_value = f"{value:.0f}"
-            elif value >= 10:
-                formatted_value = f"{value:.1f}"
-            else:
-                formatted_value = f"{value:.2f}"
-
-            return f"{formatted_value}{unit}"
-
-    # This should never be reached, but included for completeness
-    return f"{nanoseconds}ns"
+    # The number of digits picks the unit and the precision, 3 significant digits below 100 of a unit
+    divisor, template = _TIME_FORMATS.get(len(str(nanoseconds)), _WHOLE_SECONDS_FORMAT)
+    return template.format(nanoseconds / divisor, nanoseconds // divisor)
 
 
 def format_perf(percentage: float) -> str:
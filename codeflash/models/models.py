@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from rich.tree import Tree
@@ -193,6 +194,8 @@ class GeneratedTestsList(BaseModel):
 
 
 class TestFile(BaseModel):
+    __test__ = False
+
     instrumented_behavior_file_path: Path
     benchmarking_file_path: Path = None
     original_file_path: Optional[Path] = None
@@ -202,6 +205,8 @@ class TestFile(BaseModel):
 
 
 class TestFiles(BaseModel):
+    __test__ = False
+
     test_files: list[TestFile]
 
     def get_by_type(self, test_type: TestType) -> TestFiles:
@@ -246,6 +251,8 @@ class OptimizationSet(BaseModel):
 
 @dataclass(frozen=True)
 class TestsInFile:
+    __test__ = False
+
     test_file: Path
     test_class: Optional[str]
     test_function: str
@@ -372,6 +379,8 @@ class FunctionCoverage:
 
 
 class TestingMode(enum.Enum):
+    __test__ = False
+
     BEHAVIOR = "behavior"
     PERFORMANCE = "performance"
     LINE_PROFILE = "line_profile"
@@ -387,6 +396,8 @@ class VerificationType(str, Enum):
 
 
 class TestType(Enum):
+    __test__ = False
+
     EXISTING_UNIT_TEST = 1
     INSPIRED_REGRESSION = 2
     GENERATED_REGRESSION = 3
@@ -463,6 +474,8 @@ class FunctionTestInvocation:
 
 
 class TestResults(BaseModel):
+    __test__ = False
+
     # don't modify these directly, use the add method
     # also we don't support deletion of test results elements - caution is advised
     test_results: list[FunctionTestInvocation] = []
@@ -476,6 +489,7 @@ class TestResults(BaseModel):
             return
         self.test_result_idx[unique_id] = len(self.test_results)
         self.test_results.append(function_test_invocation)
+        self._clear_cached_runtime_data()
 
     def merge(self, other: TestResults) -> None:
         original_len = len(self.test_results)
@@ -485,6 +499,7 @@ class TestResults(BaseModel):
                 msg = f"Test result with id {k} already exists."
                 raise ValueError(msg)
             self.test_result_idx[k] = v + original_len
+        self._clear_cached_runtime_data()
 
     def group_by_benchmarks(
         self, benchmark_keys: list[BenchmarkKey], benchmark_replay_test_dir: Path, project_root: Path
@@ -555,7 +570,12 @@ class TestResults(BaseModel):
             )
         return tree
 
+    def _clear_cached_runtime_data(self) -> None:
+        self.__dict__.pop("usable_runtime_data_by_test_case", None)
+
+    @cached_property
     def usable_runtime_data_by_test_case(self) -> dict[InvocationId, list[int]]:
+        # Cached until the results change, since it is read for every runtime comparison. Don't modify the result.
         # Efficient single traversal, directly accumulating into a dict.
         # can track mins here and only sums can be return in total_passed_runtime
         by_id: dict[InvocationId, list[int]] = {}
@@ -581,7 +601,7 @@ class TestResults(BaseModel):
         """
         # TODO this doesn't look at the intersection of tests of baseline and original
         return sum(
-            [min(usable_runtime_data) for _, usable_runtime_data in self.usable_runtime_data_by_test_case().items()]
+            [min(usable_runtime_data) for _, usable_runtime_data in self.usable_runtime_data_by_test_case.items()]
         )
 
     def __iter__(self) -> Iterator[FunctionTestInvocation]:
@@ -595,6 +615,7 @@ class TestResults(BaseModel):
 
     def __setitem__(self, index: int, value: FunctionTestInvocation) -> None:
         self.test_results[index] = value
+        self._clear_cached_runtime_data()
 
     def __contains__(self, value: FunctionTestInvocation) -> bool:
         return value in self.test_results
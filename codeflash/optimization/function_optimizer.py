@@ -1007,10 +1007,10 @@ class FunctionOptimizer:
                         generated_tests=generated_tests, test_functions_to_remove=test_functions_to_remove
                     )
                     original_runtime_by_test = (
-                        original_code_baseline.benchmarking_test_results.usable_runtime_data_by_test_case()
+                        original_code_baseline.benchmarking_test_results.usable_runtime_data_by_test_case
                     )
                     optimized_runtime_by_test = (
-                        best_optimization.winning_benchmarking_test_results.usable_runtime_data_by_test_case()
+                        best_optimization.winning_benchmarking_test_results.usable_runtime_data_by_test_case
                     )
                     # Add runtime comments to generated tests before creating the PR
                     generated_tests = add_runtime_comments_to_generated_tests(
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import git
+from wcwidth import wcswidth
 
 from codeflash.api import cfapi
 from codeflash.cli_cmds.console import console, logger
@@ -17,17 +19,38 @@ from codeflash.code_utils.git_utils import (
     git_root_dir,
 )
 from codeflash.code_utils.github_utils import github_pr_url
-from codeflash.code_utils.tabulate import tabulate
 from codeflash.code_utils.time_utils import format_perf, format_time
 from codeflash.github.PrComment import FileDiffContent, PrComment
 from codeflash.result.critic import performance_gain
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from codeflash.models.models import FunctionCalledInTest, InvocationId
     from codeflash.result.explanation import Explanation
     from codeflash.verification.verification_utils import TestConfig
 
 
+_EXISTING_TESTS_TABLE_HEADERS = ("Test File::Test Function", "Original ⏱️", "Optimized ⏱️", "Speedup")
+
+
+def _format_pipe_table(headers: tuple[str, ...], rows: list[list[str]]) -> str:
+    """Render string cells as a left-aligned markdown pipe table, laid out exactly like tabulate's "pipe" format."""
+    # widths are display widths so that emoji and other wide characters line up, with room for two spaces of padding
+    widths = [
+        max(wcswidth(header) + 2, max((wcswidth(row[i]) for row in rows), default=0))
+        for i, header in enumerate(headers)
+    ]
+
+    def format_row(cells: Sequence[str]) -> str:
+        return "| " + " | ".join(cell + " " * (width - wcswidth(cell)) for cell, width in zip(cells, widths)) + " |"
+
+    segments = [":" + "-" * (width + 1) for width in widths]
+    lines = [format_row(headers), "|" + "|".join(segments) + "|"]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
 def existing_tests_source_for(
     function_qualified_name_with_modules_from_root: str,
     function_to_tests: dict[str, set[FunctionCalledInTest]],
@@ -38,92 +61,99 @@ def existing_tests_source_for(
     test_files = function_to_tests.get(function_qualified_name_with_modules_from_root)
     if not test_files:
         return ""
-    output: str = ""
     rows = []
-    headers = ["Test File::Test Function", "Original ⏱️", "Optimized ⏱️", "Speedup"]
     tests_root = test_cfg.tests_root
     module_root = test_cfg.project_root_path
     rel_tests_root = tests_root.relative_to(module_root)
-    original_tests_to_runtimes: dict[Path, dict[str, int]] = {}
-    optimized_tests_to_runtimes: dict[Path, dict[str, int]] = {}
-    non_generated_tests = set()
-    for test_file in test_files:
-        non_generated_tests.add(Path(test_file.tests_in_file.test_file).relative_to(tests_root))
-    # TODO confirm that original and optimized have the same keys
-    all_invocation_ids = original_runtimes_all.keys() | optimized_runtimes_all.keys()
-    for invocation_id in all_invocation_ids:
-        rel_path = (
-            Path(invocation_id.test_module_path.replace(".", os.sep)).with_suffix(".py").relative_to(rel_tests_root)
+    # keyed by (test file path relative to the tests root, qualified test name), as strings since they are only hashed
+    # and printed
+    original_tests_to_runtimes: defaultdict[tuple[str, str], int] = defaultdict(int)
+    optimized_tests_to_runtimes: defaultdict[tuple[str, str], int] = defaultdict(int)
+    non_generated_tests = {
+        str(Path(test_file.tests_in_file.test_file).relative_to(tests_root)) for test_file in test_files
+    }
+    # test module paths are relative to the project root, so strip the tests root from the front of their file path
+    rel_tests_root_prefix = "" if rel_tests_root == Path() else str(rel_tests_root) + os.sep
+    # many invocations share a test module, so resolve each module's path (or None if it is not an existing test) once
+    rel_paths: dict[str, str | None] = {}
+    for runtimes_all, tests_to_runtimes in (
+        (original_runtimes_all, original_tests_to_runtimes),
+        (optimized_runtimes_all, optimized_tests_to_runtimes),
+    ):
+        for invocation_id, runtimes in runtimes_all.items():
+            test_module_path = invocation_id.test_module_path
+            if test_module_path in rel_paths:
+                rel_path = rel_paths[test_module_path]
+            else:
+                test_module_file = test_module_path.replace(".", os.sep) + ".py"
+                rel_path = test_module_file[len(rel_tests_root_prefix) :]
+                if not test_module_file.startswith(rel_tests_root_prefix) or rel_path not in non_generated_tests:
+                    rel_path = None
+                rel_paths[test_module_path] = rel_path
+            if rel_path is None:
+                continue
+            test_class_name = invocation_id.test_class_name
+            test_function_name = invocation_id.test_function_name
+            qualified_name = f"{test_class_name}.{test_function_name}" if test_class_name else test_function_name
+            tests_to_runtimes[(rel_path, qualified_name)] += min(runtimes)  # type: ignore[index]
+    # parse into string
+    # tests without an original runtime are never reported, so only the original keys need to be visited
+    # order files component by component like Path does, so that a/test.py comes before a-b/test.py
+    for (filename, qualified_name), original_runtime in sorted(
+        original_tests_to_runtimes.items(),
+        key=lambda item: (item[0][0].split(os.sep), item[0][1]),  # noqa: PTH206
+    ):
+        optimized_runtime = optimized_tests_to_runtimes.get((filename, qualified_name), 0)
+        # if not present in optimized output nan
+        if original_runtime == 0 or optimized_runtime == 0:
+            continue
+        print_optimized_runtime = format_time(optimized_runtime)
+        print_original_runtime = format_time(original_runtime)
+        greater = optimized_runtime > original_runtime
+        perf_gain = format_perf(
+            performance_gain(original_runtime_ns=original_runtime, optimized_runtime_ns=optimized_runtime) * 100
+        )
+        status = "⚠️" if greater else "✅"
+        rows.append(
+            [
+                f"`{filename}::{qualified_name}`",
+                f"{print_original_runtime}",
+                f"{print_optimized_runtime}",
+                f"{status}{perf_gain}%",
+            ]
         )
-        if rel_path not in non_generated_tests:
+    if not rows:
+        return ""
+    return _format_pipe_table(_EXISTING_TESTS_TABLE_HEADERS, rows) + "\n"
+
+
+def _build_file_changes(
+    original_code: dict[Path, str], new_code: dict[Path, str], root: Path
+) -> dict[str, FileDiffContent]:
+    file_changes: dict[str, FileDiffContent] = {}
+    for p, old_content in original_code.items():
+        new_content = new_code[p]
+        if is_zero_diff(old_content, new_content):
             continue
-        if rel_path not in original_tests_to_runtimes:
-            original_tests_to_runtimes[rel_path] = {}
-        if rel_path not in optimized_tests_to_runtimes:
-            optimized_tests_to_runtimes[rel_path] = {}
-        qualified_name = (
-            invocation_id.test_class_name + "." + invocation_id.test_function_name  # type: ignore[operator]
-            if invocation_id.test_class_name
-            else invocation_id.test_function_name
+        file_changes[Path(p).relative_to(root).as_posix()] = FileDiffContent(
+            oldContent=old_content, newContent=new_content
         )
-        if qualified_name not in original_tests_to_runtimes[rel_path]:
-            original_tests_to_runtimes[rel_path][qualified_name] = 0  # type: ignore[index]
-        if qualified_name not in optimized_tests_to_runtimes[rel_path]:
-            optimized_tests_to_runtimes[rel_path][qualified_name] = 0  # type: ignore[index]
-        if invocation_id in original_runtimes_all:
-            original_tests_to_runtimes[rel_path][qualified_name] += min(original_runtimes_all[invocation_id])  # type: ignore[index]
-        if invocation_id in optimized_runtimes_all:
-            optimized_tests_to_runtimes[rel_path][qualified_name] += min(optimized_runtimes_all[invocation_id])  # type: ignore[index]
-    # parse into string
-    all_rel_paths = (
-        original_tests_to_runtimes.keys()
-    )  # both will have the same keys as some default values are assigned in the previous loop
-    for filename in sorted(all_rel_paths):
-        all_qualified_names = original_tests_to_runtimes[
-            filename
-        ].keys()  # both will have the same keys as some default values are assigned in the previous loop
-        for qualified_name in sorted(all_qualified_names):
-            # if not present in optimized output nan
-            if (
-                original_tests_to_runtimes[filename][qualified_name] != 0
-                and optimized_tests_to_runtimes[filename][qualified_name] != 0
-            ):
-                print_optimized_runtime = format_time(optimized_tests_to_runtimes[filename][qualified_name])
-                print_original_runtime = format_time(original_tests_to_runtimes[filename][qualified_name])
-                greater = (
-                    optimized_tests_to_runtimes[filename][qualified_name]
-                    > original_tests_to_runtimes[filename][qualified_name]
-                )
-                perf_gain = format_perf(
-                    performance_gain(
-                        original_runtime_ns=original_tests_to_runtimes[filename][qualified_name],
-                        optimized_runtime_ns=optimized_tests_to_runtimes[filename][qualified_name],
-                    )
-                    * 100
-                )
-                if greater:
-                    rows.append(
-                        [
-                            f"`{filename}::{qualified_name}`",
-                            f"{print_original_runtime}",
-                            f"{print_optimized_runtime}",
-                            f"⚠️{perf_gain}%",
-                        ]
-                    )
-                else:
-                    rows.append(
-                        [
-                            f"`{filename}::{qualified_name}`",
-                            f"{print_original_runtime}",
-                            f"{print_optimized_runtime}",
-                            f"✅{perf_gain}%",
-                        ]
-                    )
-    output += tabulate(  # type: ignore[no-untyped-call]
-        headers=headers, tabular_data=rows, tablefmt="pipe", colglobalalign=None, preserve_whitespace=True
+    return file_changes
+
+
+def _build_pr_comment(explanation: Explanation, relative_path: str) -> PrComment:
+    return PrComment(
+        optimization_explanation=explanation.explanation_message(),
+        best_runtime=explanation.best_runtime_ns,
+        original_runtime=explanation.original_runtime_ns,
+        function_name=explanation.function_name,
+        relative_file_path=relative_path,
+        speedup_x=explanation.speedup_x,
+        speedup_pct=explanation.speedup_pct,
+        winning_behavioral_test_results=explanation.winning_behavioral_test_results,
+        winning_benchmarking_test_results=explanation.winning_benchmarking_test_results,
+        benchmark_details=explanation.benchmark_details,
     )
-    output += "\n"
-    return output
 
 
 def check_create_pr(
@@ -138,38 +168,23 @@ def check_create_pr(
 ) -> None:
     pr_number: Optional[int] = env_utils.get_pr_number()
     git_repo = git.Repo(search_parent_directories=True)
+    root = git_root_dir(git_repo)
+    relative_path = explanation.file_path.relative_to(root).as_posix()
+    # check for changes before touching any remote, creating a PR without changes is as pointless as suggesting them
+    build_file_changes = _build_file_changes(original_code, new_code, root)
+    if not build_file_changes:
+        logger.info("No changes to suggest to PR." if pr_number is not None else "No changes to create a PR with.")
+        return
 
     if pr_number is not None:
         logger.info(f"Suggesting changes to PR #{pr_number} ...")
         owner, repo = get_repo_owner_and_name(git_repo)
-        relative_path = explanation.file_path.relative_to(git_root_dir()).as_posix()
-        build_file_changes = {
-            Path(p).relative_to(git_root_dir()).as_posix(): FileDiffContent(
-                oldContent=original_code[p], newContent=new_code[p]
-            )
-            for p in original_code
-            if not is_zero_diff(original_code[p], new_code[p])
-        }
-        if not build_file_changes:
-            logger.info("No changes to suggest to PR.")
-            return
         response = cfapi.suggest_changes(
             owner=owner,
             repo=repo,
             pr_number=pr_number,
             file_changes=build_file_changes,
-            pr_comment=PrComment(
-                optimization_explanation=explanation.explanation_message(),
-                best_runtime=explanation.best_runtime_ns,
-                original_runtime=explanation.original_runtime_ns,
-                function_name=explanation.function_name,
-                relative_file_path=relative_path,
-                speedup_x=explanation.speedup_x,
-                speedup_pct=explanation.speedup_pct,
-                winning_behavioral_test_results=explanation.winning_behavioral_test_results,
-                winning_benchmarking_test_results=explanation.winning_benchmarking_test_results,
-                benchmark_details=explanation.benchmark_details,
-            ),
+            pr_comment=_build_pr_comment(explanation, relative_path),
             existing_tests=existing_tests_source,
             generated_tests=generated_original_test_source,
             trace_id=function_trace_id,
@@ -191,32 +206,14 @@ def check_create_pr(
         if not check_and_push_branch(git_repo, wait_for_push=True):
             logger.warning("⏭️ Branch is not pushed, skipping PR creation...")
             return
-        relative_path = explanation.file_path.relative_to(git_root_dir()).as_posix()
-        base_branch = get_current_branch()
-        build_file_changes = {
-            Path(p).relative_to(git_root_dir()).as_posix(): FileDiffContent(
-                oldContent=original_code[p], newContent=new_code[p]
-            )
-            for p in original_code
-        }
+        base_branch = get_current_branch(git_repo)
 
         response = cfapi.create_pr(
             owner=owner,
             repo=repo,
             base_branch=base_branch,
             file_changes=build_file_changes,
-            pr_comment=PrComment(
-                optimization_explanation=explanation.explanation_message(),
-                best_runtime=explanation.best_runtime_ns,
-                original_runtime=explanation.original_runtime_ns,
-                function_name=explanation.function_name,
-                relative_file_path=relative_path,
-                speedup_x=explanation.speedup_x,
-                speedup_pct=explanation.speedup_pct,
-                winning_behavioral_test_results=explanation.winning_behavioral_test_results,
-                winning_benchmarking_test_results=explanation.winning_benchmarking_test_results,
-                benchmark_details=explanation.benchmark_details,
-            ),
+            pr_comment=_build_pr_comment(explanation, relative_path),
             existing_tests=existing_tests_source,
             generated_tests=generated_original_test_source,
             trace_id=function_trace_id,
@@ -67,6 +67,8 @@ class ModifyInspiredTests(ast.NodeTransformer):
 
 @dataclass
 class TestConfig:
+    __test__ = False
+
     tests_root: Path
     project_root_path: Path
     test_framework: str
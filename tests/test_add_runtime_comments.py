@@ -1,6 +1,6 @@
-import os
+import re
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Optional
 
 import pytest
 
@@ -9,78 +9,369 @@ from codeflash.models.models import GeneratedTests, GeneratedTestsList, Invocati
     VerificationType, TestResults
 from codeflash.verification.verification_utils import TestConfig
 
-@pytest.fixture
+TEST_MODULE_PATH = "tests.test_module"
+BEHAVIOR_FILE_PATH = Path("/project/tests/test_module.py")
+PERF_FILE_PATH = Path("/project/tests/test_module_perf.py")
+# (behavior, perf) file paths of the tests that need a test file of their own
+MODULE_1_FILE_PATHS = (Path("/project/tests/test_module1.py"), Path("/project/tests/test_module1_perf.py"))
+MODULE_2_FILE_PATHS = (Path("/project/tests/test_module2.py"), Path("/project/tests/test_module2_perf.py"))
+
+# Test sources shared by several tests
+BUBBLE_SORT_TEST_SOURCE = """def test_bubble_sort():
+    codeflash_output = bubble_sort([3, 1, 2])
+    assert codeflash_output == [1, 2, 3]
+"""
+
+SOME_FUNCTION_TEST_SOURCE = """def test_function():
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+"""
+
+MULTISTATEMENT_COMMENT_RE = re.compile(r"codeflash_output = sorter\(arr\)[^\n]*# 19\.0μs -> 14\.0μs")
+
+
+@pytest.fixture(scope="module")
 def test_config():
-    """Create a mock TestConfig for testing."""
-    config = Mock(spec=TestConfig)
-    config.project_root_path = Path("/project")
-    config.test_framework= "pytest"
-    config.tests_project_rootdir = Path("/project/tests")
-    config.tests_root = Path("/project/tests")
-    return config
+    """Create a TestConfig for testing, shared by the whole module since no test modifies it."""
+    return TestConfig(
+        tests_root=Path("/project/tests"),
+        project_root_path=Path("/project"),
+        test_framework="pytest",
+        tests_project_rootdir=Path("/project/tests"),
+    )
+
+
+def _invocation_id(
+    function_getting_tested: str,
+    iteration_id: str,
+    test_module_path: str = TEST_MODULE_PATH,
+    test_function_name: str = "test_function",
+    test_class_name: Optional[str] = None,
+) -> InvocationId:
+    """Helper to create the invocation id of a test function."""
+    return InvocationId(
+        test_module_path=test_module_path,
+        test_class_name=test_class_name,
+        test_function_name=test_function_name,
+        function_getting_tested=function_getting_tested,
+        iteration_id=iteration_id,
+    )
+
+
+def _test_invocation(invocation_id: InvocationId, runtime: int, loop_index: int = 1) -> FunctionTestInvocation:
+    """Helper to create a passing invocation of a generated regression test."""
+    return FunctionTestInvocation(
+        loop_index=loop_index,
+        id=invocation_id,
+        file_name=Path("tests/test.py"),
+        did_pass=True,
+        runtime=runtime,
+        test_framework="pytest",
+        test_type=TestType.GENERATED_REGRESSION,
+        return_value=None,
+        timed_out=False,
+        verification_type=VerificationType.FUNCTION_CALL,
+    )
+
+
+def _generated_test(
+    test_source: str,
+    file_paths: tuple[Path, Path] = (BEHAVIOR_FILE_PATH, PERF_FILE_PATH),
+    instrumented_behavior_test_source: str = "",
+    instrumented_perf_test_source: str = "",
+) -> GeneratedTests:
+    """Helper to create a generated test with the given source and (behavior, perf) file paths."""
+    behavior_file_path, perf_file_path = file_paths
+    return GeneratedTests(
+        generated_original_test_source=test_source,
+        instrumented_behavior_test_source=instrumented_behavior_test_source,
+        instrumented_perf_test_source=instrumented_perf_test_source,
+        behavior_file_path=behavior_file_path,
+        perf_file_path=perf_file_path,
+    )
+
+
+def _generated_tests_list(*generated_tests: GeneratedTests) -> GeneratedTestsList:
+    """Helper to create a GeneratedTestsList holding the given generated tests."""
+    return GeneratedTestsList(generated_tests=list(generated_tests))
+
+
+# The invocation of test_bubble_sort in BUBBLE_SORT_TEST_SOURCE
+BUBBLE_SORT_INVOCATION_ID = _invocation_id("bubble_sort", "0", test_function_name="test_bubble_sort")
+
+NO_CODEFLASH_OUTPUT_TEST_SOURCE = """def test_function():
+    result = some_function()
+    assert result == expected
+"""
 
-class TestAddRuntimeComments:
-    """Test cases for add_runtime_comments_to_generated_tests method."""
+# Sources of the two generated tests of test_add_runtime_comments_multiple_tests, before and after annotation
+FUNCTION_1_TEST_SOURCE = """def test_function1():
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+"""
 
-    def create_test_invocation(
-        self, test_function_name: str, runtime: int, loop_index: int = 1, iteration_id: str = "1", did_pass: bool = True
-    ) -> FunctionTestInvocation:
-        """Helper to create test invocation objects."""
-        return FunctionTestInvocation(
-            loop_index=loop_index,
-            id=InvocationId(
-                test_module_path="tests.test_module",
-                test_class_name=None,
-                test_function_name=test_function_name,
-                function_getting_tested="test_function",
-                iteration_id=iteration_id,
-            ),
-            file_name=Path("tests/test.py"),
-            did_pass=did_pass,
-            runtime=runtime,
-            test_framework="pytest",
-            test_type=TestType.GENERATED_REGRESSION,
-            return_value=None,
-            timed_out=False,
-            verification_type=VerificationType.FUNCTION_CALL,
-        )
+FUNCTION_2_TEST_SOURCE = """def test_function2():
+    codeflash_output = another_function()
+    assert codeflash_output == expected
+"""
 
-    def test_basic_runtime_comment_addition(self, test_config):
-        """Test basic functionality of adding runtime comments."""
-        # Create test source code
-        test_source = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
+FUNCTION_1_EXPECTED_SOURCE = """def test_function1():
+    codeflash_output = some_function() # 1.00s -> 500ms (100% faster)
+    assert codeflash_output == expected
 """
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
+FUNCTION_2_EXPECTED_SOURCE = """def test_function2():
+    codeflash_output = another_function() # 2.00s -> 800ms (150% faster)
+    assert codeflash_output == expected
+"""
 
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
+# (test source, original runtimes, optimized runtimes, expected source) of a single generated test
+ADD_RUNTIME_COMMENTS_CASES = [
+    pytest.param(
+        """def test_function():
+    setup_data = prepare_test()
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+    codeflash_output = another_function()
+    assert codeflash_output == expected2
+""",
+        {
+            _invocation_id("some_function", "1"): [1_500_000_000],  # 1.5s
+            _invocation_id("another_function", "3"): [10],
+        },
+        {
+            _invocation_id("some_function", "1"): [750_000_000],  # 0.75s
+            _invocation_id("another_function", "3"): [5],
+        },
+        """def test_function():
+    setup_data = prepare_test()
+    codeflash_output = some_function() # 1.50s -> 750ms (100% faster)
+    assert codeflash_output == expected
+    codeflash_output = another_function() # 10ns -> 5ns (100% faster)
+    assert codeflash_output == expected2
+""",
+        id="multiple_assignments",
+    ),
+    pytest.param(
+        SOME_FUNCTION_TEST_SOURCE,
+        # Different invocation ID that won't match
+        {_invocation_id("some_other_function", "0", "tests.other_module", "other_function"): [1_000_000_000]},
+        {_invocation_id("some_other_function", "0", "tests.other_module", "other_function"): [500_000_000]},
+        SOME_FUNCTION_TEST_SOURCE,
+        id="no_matching_runtimes",
+    ),
+    pytest.param(
+        NO_CODEFLASH_OUTPUT_TEST_SOURCE,
+        {_invocation_id("some_function", "0"): [1_000_000_000]},
+        {_invocation_id("some_function", "0"): [500_000_000]},
+        NO_CODEFLASH_OUTPUT_TEST_SOURCE,
+        id="no_codeflash_output",
+    ),
+    pytest.param(
+        """def test_function():
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "0"): [1_000_000_000], _invocation_id("some_function", "2"): [2]},  # 1s
+        # 1.5s, the optimized version is slower (negative performance gain)
+        {_invocation_id("some_function", "0"): [1_500_000_000], _invocation_id("some_function", "2"): [1]},
+        """def test_function():
+    codeflash_output = some_function() # 1.00s -> 1.50s (33.3% slower)
+    assert codeflash_output == expected
+    codeflash_output = some_function() # 2ns -> 1ns (100% faster)
+    assert codeflash_output == expected
+""",
+        id="performance_regression",
+    ),
+    # The cases below pin the statement lines found by tokenize to what the libcst transformer annotated
+    pytest.param(
+        """def test_function():
+    setup_data = prepare_test(); codeflash_output = some_function()
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "1"): [1_000_000]},
+        {_invocation_id("some_function", "1"): [500_000]},
+        """def test_function():
+    setup_data = prepare_test(); codeflash_output = some_function() # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="semicolon_statements",
+    ),
+    pytest.param(
+        """def test_function():
+    codeflash_output = result = some_function()
+    assert codeflash_output == expected
+    codeflash_output = another_function()
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "0"): [1_000_000], _invocation_id("another_function", "2"): [1_000_000]},
+        {_invocation_id("some_function", "0"): [500_000], _invocation_id("another_function", "2"): [500_000]},
+        # a chained assignment has more than one target, so it gets no comment
+        """def test_function():
+    codeflash_output = result = some_function()
+    assert codeflash_output == expected
+    codeflash_output = another_function() # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="chained_assignment",
+    ),
+    pytest.param(
+        """def test_function():
+    codeflash_output = some_function(
+        1,
+        2,
+    )  # old comment
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "0"): [1_000_000]},
+        {_invocation_id("some_function", "0"): [500_000]},
+        """def test_function():
+    codeflash_output = some_function(
+        1,
+        2,
+    ) # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="multi_line_call",
+    ),
+    pytest.param(
+        """async def test_function():
+    codeflash_output = await some_function()
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "0"): [1_000_000]},
+        {_invocation_id("some_function", "0"): [500_000]},
+        """async def test_function():
+    codeflash_output = await some_function() # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="async_test",
+    ),
+    pytest.param(
+        """@pytest.mark.timeout(10)
+def test_function():
+    codeflash_output = some_function()
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "0"): [1_000_000]},
+        {_invocation_id("some_function", "0"): [500_000]},
+        """@pytest.mark.timeout(10)
+def test_function():
+    codeflash_output = some_function() # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="decorated_test",
+    ),
+    pytest.param(
+        """def test_function():
+    data = "a\x0cb"
+    codeflash_output = some_function(data)
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "1"): [1_000_000]},
+        {_invocation_id("some_function", "1"): [500_000]},
+        # str.splitlines breaks lines on a form feed, tokenize does not
+        """def test_function():
+    data = "a\x0cb"
+    codeflash_output = some_function(data) # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="form_feed_in_string",
+    ),
+    pytest.param(
+        """def test_function():
+    data = "a\u2028b"
+    codeflash_output = some_function(data)
+    assert codeflash_output == expected
+""",
+        {_invocation_id("some_function", "1"): [1_000_000]},
+        {_invocation_id("some_function", "1"): [500_000]},
+        """def test_function():
+    data = "a\u2028b"
+    codeflash_output = some_function(data) # 1.00ms -> 500μs (100% faster)
+    assert codeflash_output == expected
+""",
+        id="line_separator_in_string",
+    ),
+]
 
-        # Add test invocations with different runtimes
-        original_invocation = self.create_test_invocation("test_bubble_sort", 500_000, iteration_id='0')  # 500μs
-        optimized_invocation = self.create_test_invocation("test_bubble_sort", 300_000, iteration_id='0')  # 300μs
 
-        original_test_results.add(original_invocation)
-        optimized_test_results.add(optimized_invocation)
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
-        # Test the functionality
-        result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
+class TestAddRuntimeComments:
+    """Test cases for add_runtime_comments_to_generated_tests method."""
 
-        # Check that comments were added
-        modified_source = result.generated_tests[0].generated_original_test_source
-        assert "# 500μs -> 300μs" in modified_source
-        assert "codeflash_output = bubble_sort([3, 1, 2]) # 500μs -> 300μs" in modified_source
+    @pytest.mark.parametrize(
+        ("test_source", "test_class_name", "test_function_name", "original_times", "optimized_times", "expected_source"),
+        [
+            pytest.param(
+                BUBBLE_SORT_TEST_SOURCE,
+                None,
+                "test_bubble_sort",
+                [500_000],  # 500μs
+                [300_000],  # 300μs
+                """def test_bubble_sort():
+    codeflash_output = bubble_sort([3, 1, 2]) # 500μs -> 300μs (66.7% faster)
+    assert codeflash_output == [1, 2, 3]
+""",
+                id="basic",
+            ),
+            pytest.param(
+                SOME_FUNCTION_TEST_SOURCE,
+                None,
+                "test_function",
+                [1_000_000_000, 1_200_000_000],  # 1s, 1.2s
+                [500_000_000, 600_000_000],  # 0.5s, 0.6s
+                """def test_function():
+    codeflash_output = some_function() # 1.00s -> 500ms (100% faster)
+    assert codeflash_output == expected
+""",
+                id="simple_function",
+            ),
+            pytest.param(
+                """class TestClass:
+    def test_function(self):
+        codeflash_output = some_function()
+        assert codeflash_output == expected
+""",
+                "TestClass",
+                "test_function",
+                [2_000_000_000],  # 2s
+                [1_000_000_000],  # 1s
+                """class TestClass:
+    def test_function(self):
+        codeflash_output = some_function() # 2.00s -> 1.00s (100% faster)
+        assert codeflash_output == expected
+""",
+                id="class_method",
+            ),
+        ],
+    )
+    def test_single_assignment_annotation(
+        self,
+        test_config,
+        test_source,
+        test_class_name,
+        test_function_name,
+        original_times,
+        optimized_times,
+        expected_source,
+    ):
+        """Test that a single codeflash_output assignment gets its runtime comment appended."""
+        generated_tests = _generated_tests_list(_generated_test(test_source))
+
+        invocation_id = _invocation_id(
+            "some_function", "0", test_function_name=test_function_name, test_class_name=test_class_name
+        )
+        original_runtimes = {invocation_id: original_times}
+        optimized_runtimes = {invocation_id: optimized_times}
+
+        result = add_runtime_comments_to_generated_tests(
+            test_config, generated_tests, original_runtimes, optimized_runtimes
+        )
+
+        assert len(result.generated_tests) == 1
+        assert result.generated_tests[0].generated_original_test_source == expected_source
 
     def test_multiple_test_functions(self, test_config):
         """Test handling multiple test functions in the same file."""
@@ -96,29 +387,12 @@ def helper_function():
     return "not a test"
 """
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Create test results for both functions
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        # Add test invocations for both test functions
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000, iteration_id='0'))
-        original_test_results.add(self.create_test_invocation("test_quick_sort", 800_000, iteration_id='0'))
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000, iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_quick_sort", 600_000, iteration_id='0'))
-
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        quick_sort_invocation_id = _invocation_id("quick_sort", "0", test_function_name="test_quick_sort")
+        original_runtimes = {BUBBLE_SORT_INVOCATION_ID: [500_000], quick_sort_invocation_id: [800_000]}
+        optimized_runtimes = {BUBBLE_SORT_INVOCATION_ID: [300_000], quick_sort_invocation_id: [600_000]}
 
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
@@ -134,74 +408,48 @@ def helper_function():
             and "# " not in modified_source.split("helper_function():")[1].split("\n")[0]
         )
 
-    def test_different_time_formats(self, test_config):
-        """Test that different time ranges are formatted correctly with new precision rules."""
-        test_cases = [
+    TIME_FORMAT_TEST_SOURCE = """def test_function():
+    # a comment line before the annotated assignment is kept as is
+    codeflash_output = some_function()
+    assert codeflash_output is not None
+"""
+
+    @pytest.mark.parametrize(
+        ("original_time", "optimized_time", "expected_comment"),
+        [
             (999, 500, "999ns -> 500ns"),  # nanoseconds
             (25_000, 18_000, "25.0μs -> 18.0μs"),  # microseconds with precision
             (500_000, 300_000, "500μs -> 300μs"),  # microseconds full integers
             (1_500_000, 800_000, "1.50ms -> 800μs"),  # milliseconds with precision
             (365_000_000, 290_000_000, "365ms -> 290ms"),  # milliseconds full integers
             (2_000_000_000, 1_500_000_000, "2.00s -> 1.50s"),  # seconds with precision
-        ]
-
-        for original_time, optimized_time, expected_comment in test_cases:
-            test_source = """def test_function():
-    #this comment will be removed in ast form
-    codeflash_output = some_function()
-    assert codeflash_output is not None
-"""
-
-            generated_test = GeneratedTests(
-                generated_original_test_source=test_source,
-                instrumented_behavior_test_source="",
-                instrumented_perf_test_source="",
-                behavior_file_path=Path("/project/tests/test_module.py"),
-                perf_file_path=Path("/project/tests/test_module_perf.py")
-            )
-
-            generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-            # Create test results
-            original_test_results = TestResults()
-            optimized_test_results = TestResults()
-
-            original_test_results.add(self.create_test_invocation("test_function", original_time, iteration_id='0'))
-            optimized_test_results.add(self.create_test_invocation("test_function", optimized_time, iteration_id='0'))
+        ],
+    )
+    def test_different_time_formats(self, test_config, original_time, optimized_time, expected_comment):
+        """Test that different time ranges are formatted correctly with new precision rules."""
+        generated_tests = _generated_tests_list(_generated_test(self.TIME_FORMAT_TEST_SOURCE))
 
-            original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-            optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
-            # Test the functionality
-            result = add_runtime_comments_to_generated_tests(
-                test_config, generated_tests, original_runtimes, optimized_runtimes
-            )
+        # Create the runtimes of each test invocation
+        invocation_id = _invocation_id("some_function", "0")
+        original_runtimes = {invocation_id: [original_time]}
+        optimized_runtimes = {invocation_id: [optimized_time]}
+        # Test the functionality
+        result = add_runtime_comments_to_generated_tests(
+            test_config, generated_tests, original_runtimes, optimized_runtimes
+        )
 
-            modified_source = result.generated_tests[0].generated_original_test_source
-            assert f"# {expected_comment}" in modified_source
+        modified_source = result.generated_tests[0].generated_original_test_source
+        assert f"# {expected_comment}" in modified_source
 
     def test_missing_test_results(self, test_config):
         """Test behavior when test results are missing for a test function."""
-        test_source = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
-"""
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
+        test_source = BUBBLE_SORT_TEST_SOURCE
 
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        # Create empty test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # No test invocations have runtimes
+        original_runtimes = {}
+        optimized_runtimes = {}
 
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
@@ -212,29 +460,13 @@ def helper_function():
 
     def test_partial_test_results(self, test_config):
         """Test behavior when only one set of test results is available."""
-        test_source = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
-"""
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
+        test_source = BUBBLE_SORT_TEST_SOURCE
 
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        # Create test results with only original data
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000, iteration_id='0'))
-        # No optimized results
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Only the original test invocation has a runtime
+        original_runtimes = {BUBBLE_SORT_INVOCATION_ID: [500_000]}
+        optimized_runtimes = {}
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
 
@@ -244,36 +476,22 @@ def helper_function():
 
     def test_multiple_runtimes_uses_minimum(self, test_config):
         """Test that when multiple runtimes exist, the minimum is used."""
-        test_source = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
-"""
+        test_source = BUBBLE_SORT_TEST_SOURCE
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
         # Create test results with multiple loop iterations
         original_test_results = TestResults()
         optimized_test_results = TestResults()
 
         # Add multiple runs with different runtimes
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 600_000, loop_index=1,iteration_id='0'))
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000, loop_index=2,iteration_id='0'))
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 550_000, loop_index=3,iteration_id='0'))
-
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 350_000, loop_index=1,iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000, loop_index=2,iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 320_000, loop_index=3,iteration_id='0'))
+        for loop_index, runtime in enumerate([600_000, 500_000, 550_000], start=1):
+            original_test_results.add(_test_invocation(BUBBLE_SORT_INVOCATION_ID, runtime, loop_index=loop_index))
+        for loop_index, runtime in enumerate([350_000, 300_000, 320_000], start=1):
+            optimized_test_results.add(_test_invocation(BUBBLE_SORT_INVOCATION_ID, runtime, loop_index=loop_index))
 
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        original_runtimes = original_test_results.usable_runtime_data_by_test_case
+        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
 
@@ -288,25 +506,12 @@ def helper_function():
     assert result == [1, 2, 3]
 """
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000,iteration_id='-1'))
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000,iteration_id='-1'))
-
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        invocation_id = _invocation_id("bubble_sort", "-1", test_function_name="test_bubble_sort")
+        original_runtimes = {invocation_id: [500_000]}
+        optimized_runtimes = {invocation_id: [300_000]}
 
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
@@ -322,25 +527,11 @@ def helper_function():
     assert codeflash_output == [1, 2, 3]
 """  # Invalid syntax: extra indentation
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000,iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000,iteration_id='0'))
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        original_runtimes = {BUBBLE_SORT_INVOCATION_ID: [500_000]}
+        optimized_runtimes = {BUBBLE_SORT_INVOCATION_ID: [300_000]}
 
         # Test the functionality - should handle parse error gracefully
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
@@ -351,10 +542,7 @@ def helper_function():
 
     def test_multiple_generated_tests(self, test_config):
         """Test handling multiple generated test objects."""
-        test_source_1 = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
-"""
+        test_source_1 = BUBBLE_SORT_TEST_SOURCE
 
         test_source_2 = """def test_quick_sort():
     a=1
@@ -364,36 +552,12 @@ def helper_function():
     assert codeflash_output == [2, 5, 8]
 """
 
-        generated_test_1 = GeneratedTests(
-            generated_original_test_source=test_source_1,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_test_2 = GeneratedTests(
-            generated_original_test_source=test_source_2,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test_1, generated_test_2])
-
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000,iteration_id='0'))
-        original_test_results.add(self.create_test_invocation("test_quick_sort", 800_000,iteration_id='3'))
+        generated_tests = _generated_tests_list(_generated_test(test_source_1), _generated_test(test_source_2))
 
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000,iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_quick_sort", 600_000,iteration_id='3'))
-
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        quick_sort_invocation_id = _invocation_id("quick_sort", "3", test_function_name="test_quick_sort")
+        original_runtimes = {BUBBLE_SORT_INVOCATION_ID: [500_000], quick_sort_invocation_id: [800_000]}
+        optimized_runtimes = {BUBBLE_SORT_INVOCATION_ID: [300_000], quick_sort_invocation_id: [600_000]}
 
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
@@ -407,35 +571,25 @@ def helper_function():
 
     def test_preserved_test_attributes(self, test_config):
         """Test that other test attributes are preserved during modification."""
-        test_source = """def test_bubble_sort():
-    codeflash_output = bubble_sort([3, 1, 2])
-    assert codeflash_output == [1, 2, 3]
-"""
+        test_source = BUBBLE_SORT_TEST_SOURCE
 
         original_behavior_source = "behavior test source"
         original_perf_source = "perf test source"
-        original_behavior_path = Path("/project/tests/test_module.py")
-        original_perf_path = Path("/project/tests/test_module_perf.py")
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source=original_behavior_source,
-            instrumented_perf_test_source=original_perf_source,
-            behavior_file_path=original_behavior_path,
-            perf_file_path=original_perf_path
+        original_behavior_path = BEHAVIOR_FILE_PATH
+        original_perf_path = PERF_FILE_PATH
+
+        generated_tests = _generated_tests_list(
+            _generated_test(
+                test_source,
+                (original_behavior_path, original_perf_path),
+                instrumented_behavior_test_source=original_behavior_source,
+                instrumented_perf_test_source=original_perf_source,
+            )
         )
 
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_test_results.add(self.create_test_invocation("test_bubble_sort", 500_000,iteration_id='0'))
-        optimized_test_results.add(self.create_test_invocation("test_bubble_sort", 300_000,iteration_id='0'))
-
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        original_runtimes = {BUBBLE_SORT_INVOCATION_ID: [500_000]}
+        optimized_runtimes = {BUBBLE_SORT_INVOCATION_ID: [300_000]}
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
 
@@ -459,299 +613,30 @@ def helper_function():
     assert arr == [1, 2, 3]  # Input should be mutated
 """
 
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py")
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Create test results
-        original_test_results = TestResults()
-        optimized_test_results = TestResults()
-
-        original_test_results.add(self.create_test_invocation("test_mutation_of_input", 19_000,iteration_id='1'))  # 19μs
-        optimized_test_results.add(self.create_test_invocation("test_mutation_of_input", 14_000,iteration_id='1'))  # 14μs
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
-        original_runtimes = original_test_results.usable_runtime_data_by_test_case()
-        optimized_runtimes = optimized_test_results.usable_runtime_data_by_test_case()
+        # Create the runtimes of each test invocation
+        invocation_id = _invocation_id("sorter", "1", test_function_name="test_mutation_of_input")
+        original_runtimes = {invocation_id: [19_000]}  # 19μs
+        optimized_runtimes = {invocation_id: [14_000]}  # 14μs
 
         # Test the functionality
         result = add_runtime_comments_to_generated_tests(test_config, generated_tests, original_runtimes, optimized_runtimes)
 
-        # Check that comments were added to the correct line
-        modified_source = result.generated_tests[0].generated_original_test_source
-        assert "# 19.0μs -> 14.0μs" in modified_source
-
         # Verify the comment is on the line with codeflash_output assignment
-        lines = modified_source.split("\n")
-        codeflash_line = None
-        for line in lines:
-            if "codeflash_output = sorter(arr)" in line:
-                codeflash_line = line
-                break
-
-        assert codeflash_line is not None, "Could not find codeflash_output assignment line"
-        assert "# 19.0μs -> 14.0μs" in codeflash_line, f"Comment not found in the correct line: {codeflash_line}"
-
-
-    def test_add_runtime_comments_simple_function(self, test_config):
-        """Test adding runtime comments to a simple test function."""
-        test_source = '''def test_function():
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        invocation_id = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="0",
-        )
-
-        original_runtimes = {invocation_id: [1000000000, 1200000000]}  # 1s, 1.2s in nanoseconds
-        optimized_runtimes = {invocation_id: [500000000, 600000000]}   # 0.5s, 0.6s in nanoseconds
-
-        result = add_runtime_comments_to_generated_tests(
-            test_config, generated_tests, original_runtimes, optimized_runtimes
-        )
-
-        expected_source = '''def test_function():
-    codeflash_output = some_function() # 1.00s -> 500ms (100% faster)
-    assert codeflash_output == expected
-'''
-
-        assert len(result.generated_tests) == 1
-        assert result.generated_tests[0].generated_original_test_source == expected_source
-
-    def test_add_runtime_comments_class_method(self, test_config):
-        """Test adding runtime comments to a test method within a class."""
-        test_source = '''class TestClass:
-    def test_function(self):
-        codeflash_output = some_function()
-        assert codeflash_output == expected
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        invocation_id = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name="TestClass",
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="0",
-
-        )
-
-        original_runtimes = {invocation_id: [2000000000]}  # 2s in nanoseconds
-        optimized_runtimes = {invocation_id: [1000000000]} # 1s in nanoseconds
-
-        result = add_runtime_comments_to_generated_tests(
-            test_config, generated_tests, original_runtimes, optimized_runtimes
-        )
-
-        expected_source = '''class TestClass:
-    def test_function(self):
-        codeflash_output = some_function() # 2.00s -> 1.00s (100% faster)
-        assert codeflash_output == expected
-'''
-
-        assert len(result.generated_tests) == 1
-        assert result.generated_tests[0].generated_original_test_source == expected_source
-
-    def test_add_runtime_comments_multiple_assignments(self, test_config):
-        """Test adding runtime comments when there are multiple codeflash_output assignments."""
-        test_source = '''def test_function():
-    setup_data = prepare_test()
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-    codeflash_output = another_function()
-    assert codeflash_output == expected2
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        invocation_id1 = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="1",
-        )
-        invocation_id2 = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="another_function",
-            iteration_id="3",
-        )
-
-        original_runtimes = {invocation_id1: [1500000000], invocation_id2: [10]}  # 1.5s in nanoseconds
-        optimized_runtimes = {invocation_id1: [750000000], invocation_id2: [5]}  # 0.75s in nanoseconds
-
-        result = add_runtime_comments_to_generated_tests(
-            test_config, generated_tests, original_runtimes, optimized_runtimes
-        )
-
-        expected_source = '''def test_function():
-    setup_data = prepare_test()
-    codeflash_output = some_function() # 1.50s -> 750ms (100% faster)
-    assert codeflash_output == expected
-    codeflash_output = another_function() # 10ns -> 5ns (100% faster)
-    assert codeflash_output == expected2
-'''
-
-        assert len(result.generated_tests) == 1
-        assert result.generated_tests[0].generated_original_test_source == expected_source
-
-    def test_add_runtime_comments_no_matching_runtimes(self, test_config):
-        """Test that source remains unchanged when no matching runtimes are found."""
-        test_source = '''def test_function():
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        # Different invocation ID that won't match
-        invocation_id = InvocationId(
-            test_module_path="tests.other_module",
-            test_class_name=None,
-            test_function_name="other_function",
-            function_getting_tested="some_other_function",
-            iteration_id="0",
-        )
-
-        original_runtimes = {invocation_id: [1000000000]}
-        optimized_runtimes = {invocation_id: [500000000]}
-
-        result = add_runtime_comments_to_generated_tests(
-            test_config, generated_tests, original_runtimes, optimized_runtimes
-        )
-
-        # Source should remain unchanged
-        assert len(result.generated_tests) == 1
-        assert result.generated_tests[0].generated_original_test_source == test_source
-
-    def test_add_runtime_comments_no_codeflash_output(self, test_config):
-        """Test that source remains unchanged when there's no codeflash_output assignment."""
-        test_source = '''def test_function():
-    result = some_function()
-    assert result == expected
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        invocation_id = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="0",
-        )
-
-        original_runtimes = {invocation_id: [1000000000]}
-        optimized_runtimes = {invocation_id: [500000000]}
-
-        result = add_runtime_comments_to_generated_tests(
-            test_config, generated_tests, original_runtimes, optimized_runtimes
-        )
+        modified_source = result.generated_tests[0].generated_original_test_source
+        assert MULTISTATEMENT_COMMENT_RE.search(modified_source), modified_source
 
-        # Source should remain unchanged
-        assert len(result.generated_tests) == 1
-        assert result.generated_tests[0].generated_original_test_source == test_source
 
     def test_add_runtime_comments_multiple_tests(self, test_config):
         """Test adding runtime comments to multiple generated tests."""
-        test_source1 = '''def test_function1():
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-'''
-
-        test_source2 = '''def test_function2():
-    codeflash_output = another_function()
-    assert codeflash_output == expected
-'''
-
-        generated_test1 = GeneratedTests(
-            generated_original_test_source=test_source1,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module1.py"),
-            perf_file_path=Path("/project/tests/test_module1_perf.py"),
-        )
-
-        generated_test2 = GeneratedTests(
-            generated_original_test_source=test_source2,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module2.py"),
-            perf_file_path=Path("/project/tests/test_module2_perf.py"),
-        )
-
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test1, generated_test2])
-
-        invocation_id1 = InvocationId(
-            test_module_path="tests.test_module1",
-            test_class_name=None,
-            test_function_name="test_function1",
-            function_getting_tested="some_function",
-            iteration_id="0",
+        generated_tests = _generated_tests_list(
+            _generated_test(FUNCTION_1_TEST_SOURCE, MODULE_1_FILE_PATHS),
+            _generated_test(FUNCTION_2_TEST_SOURCE, MODULE_2_FILE_PATHS),
         )
 
-        invocation_id2 = InvocationId(
-            test_module_path="tests.test_module2",
-            test_class_name=None,
-            test_function_name="test_function2",
-            function_getting_tested="another_function",
-            iteration_id = "0",
-        )
+        invocation_id1 = _invocation_id("some_function", "0", "tests.test_module1", "test_function1")
+        invocation_id2 = _invocation_id("another_function", "0", "tests.test_module2", "test_function2")
 
         original_runtimes = {
             invocation_id1: [1000000000],  # 1s
@@ -766,68 +651,20 @@ def helper_function():
             test_config, generated_tests, original_runtimes, optimized_runtimes
         )
 
-        expected_source1 = '''def test_function1():
-    codeflash_output = some_function() # 1.00s -> 500ms (100% faster)
-    assert codeflash_output == expected
-'''
-
-        expected_source2 = '''def test_function2():
-    codeflash_output = another_function() # 2.00s -> 800ms (150% faster)
-    assert codeflash_output == expected
-'''
-
         assert len(result.generated_tests) == 2
-        assert result.generated_tests[0].generated_original_test_source == expected_source1
-        assert result.generated_tests[1].generated_original_test_source == expected_source2
-
-    def test_add_runtime_comments_performance_regression(self, test_config):
-        """Test adding runtime comments when optimized version is slower (negative performance gain)."""
-        test_source = '''def test_function():
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-    codeflash_output = some_function()
-    assert codeflash_output == expected
-'''
-
-        generated_test = GeneratedTests(
-            generated_original_test_source=test_source,
-            instrumented_behavior_test_source="",
-            instrumented_perf_test_source="",
-            behavior_file_path=Path("/project/tests/test_module.py"),
-            perf_file_path=Path("/project/tests/test_module_perf.py"),
-        )
+        assert result.generated_tests[0].generated_original_test_source == FUNCTION_1_EXPECTED_SOURCE
+        assert result.generated_tests[1].generated_original_test_source == FUNCTION_2_EXPECTED_SOURCE
 
-        generated_tests = GeneratedTestsList(generated_tests=[generated_test])
-
-        invocation_id1 = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="0",
-        )
-
-        invocation_id2 = InvocationId(
-            test_module_path="tests.test_module",
-            test_class_name=None,
-            test_function_name="test_function",
-            function_getting_tested="some_function",
-            iteration_id="2",
-        )
-
-        original_runtimes = {invocation_id1: [1000000000], invocation_id2: [2]}  # 1s
-        optimized_runtimes = {invocation_id1: [1500000000], invocation_id2: [1]} # 1.5s (slower!)
+    @pytest.mark.parametrize(
+        ("test_source", "original_runtimes", "optimized_runtimes", "expected_source"), ADD_RUNTIME_COMMENTS_CASES
+    )
+    def test_add_runtime_comments(self, test_config, test_source, original_runtimes, optimized_runtimes, expected_source):
+        """Test the runtime comments added to, or left off, a single generated test."""
+        generated_tests = _generated_tests_list(_generated_test(test_source))
 
         result = add_runtime_comments_to_generated_tests(
             test_config, generated_tests, original_runtimes, optimized_runtimes
         )
 
-        expected_source = '''def test_function():
-    codeflash_output = some_function() # 1.00s -> 1.50s (33.3% slower)
-    assert codeflash_output == expected
-    codeflash_output = some_function() # 2ns -> 1ns (100% faster)
-    assert codeflash_output == expected
-'''
-
         assert len(result.generated_tests) == 1
         assert result.generated_tests[0].generated_original_test_source == expected_source
@@ -2455,3 +2455,91 @@ def test_replace_functions_and_add_imports():
     assert "import ApiClient" not in new_code, "Error: Circular dependency found"
     
     assert "import urllib.parse" in new_code, "Make sure imports for optimization global assignments exist" 
+
+
+def test_add_global_assignments_replaces_existing_assignments_in_place():
+    src_code = """MAX_SIZE = 512
+DEFAULTS = {
+    "a": 1,
+}
+
+def helper():
+    return MAX_SIZE
+"""
+    dst_code = """import os
+
+MAX_SIZE = 256  # keep this comment
+DEFAULTS = {}
+
+try:
+    DEFAULTS = {"b": 2}
+except ImportError:
+    pass
+
+if os.name == "nt":
+    MAX_SIZE = 128
+"""
+    expected = """import os
+
+MAX_SIZE = 512  # keep this comment
+DEFAULTS = {
+    "a": 1,
+}
+
+try:
+    DEFAULTS = {
+        "a": 1,
+    }
+except ImportError:
+    pass
+
+if os.name == "nt":
+    MAX_SIZE = 128
+"""
+    assert add_global_assignments(src_code, dst_code) == expected
+
+
+def test_add_global_assignments_appends_new_assignments_and_statements():
+    src_code = """X = 1
+NEW_CONSTANT = 2
+print(X)
+"""
+    dst_code = """import sys
+
+X = 0
+"""
+    expected = """import sys
+print(X)
+
+X = 1
+
+NEW_CONSTANT = 2
+"""
+    assert add_global_assignments(src_code, dst_code) == expected
+
+
+def test_add_global_assignments_inserts_statements_after_module_level_imports():
+    src_code = """logging.basicConfig()
+"""
+    dst_code = """import logging
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+"""
+    expected = """import logging
+logging.basicConfig()
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+"""
+    assert add_global_assignments(src_code, dst_code) == expected
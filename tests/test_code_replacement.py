@@ -1515,6 +1515,35 @@ from __future__ import annotations as _annotations
     assert delete___future___aliased_imports(module_code6) == expected_code6
 
 
+def test_future_aliased_imports_removal_multiline() -> None:
+    module_code1 = """from __future__ import (
+    annotations as _annotations,
+    division,
+)
+print("Hello monde")
+"""
+    expected_code1 = """from __future__ import (
+    division,
+)
+print("Hello monde")
+"""
+    assert delete___future___aliased_imports(module_code1) == expected_code1
+
+    module_code2 = """from __future__ import \\
+    annotations as _annotations
+print("Hello monde")
+"""
+    expected_code2 = """print("Hello monde")
+"""
+    assert delete___future___aliased_imports(module_code2) == expected_code2
+
+    module_code3 = """from __future__ import annotations
+
+import numpy as np
+"""
+    assert delete___future___aliased_imports(module_code3) == module_code3
+
+
 def test_0_diff_code_replacement():
     original_code = """from __future__ import annotations
 
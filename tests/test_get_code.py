@@ -270,3 +270,35 @@ class CustomDataClass:
         )
         assert new_code is None
         assert contextual_dunder_methods == set()
+
+
+def test_get_code_reparses_modified_file() -> None:
+    code = """def test(self):
+    return self._test"""
+    modified_code = """def test(self):
+    return self._test + 1"""
+
+    with tempfile.NamedTemporaryFile("w") as f:
+        f.write(code)
+        f.flush()
+
+        new_code, _ = get_code([FunctionToOptimize("test", f.name, [])])
+        assert new_code == code
+
+        f.seek(0)
+        f.write(modified_code)
+        f.flush()
+
+        new_code, _ = get_code([FunctionToOptimize("test", f.name, [])])
+        assert new_code == modified_code
+
+
+def test_get_code_with_form_feed_and_unicode_separators() -> None:
+    code = "X = 1\n\x0c\ndef f():\n    # \x1c separator\n    return 1\n\ndef g():\n    return 2\n"
+
+    with tempfile.NamedTemporaryFile("w") as f:
+        f.write(code)
+        f.flush()
+
+        new_code, _ = get_code([FunctionToOptimize("g", f.name, [])])
+        assert new_code == "def g():\n    return 2\n"